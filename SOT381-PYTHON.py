@@ -1,7 +1,20 @@
+import os
+import sys
+
+# tin_a nằm cùng thư mục với file này; thêm vào sys.path để chạy được từ bất kỳ đâu.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tin_a.keywords import KeywordSet
+from tin_a.predicates import divisible_by, gt
+
 # Bai 1
+# Điều kiện: số chẵn, lớn hơn 10 và chia hết cho 3.
+# BAI1.count(a, b) / BAI1.matches(a, b) đếm / liệt kê các số thỏa mãn trong [a, b].
+BAI1 = divisible_by(2) & gt(10) & divisible_by(3)
+
 def bai1():
     num = int(input("Nhập số cần kiểm tra: "))
-    if num % 2 == 0 and num > 10 and num % 3 == 0:
+    if BAI1(num):
         print("Số thỏa mãn tất cả điều kiện.")
     else:
         print("Số KHÔNG thỏa mãn đủ điều kiện.")
@@ -25,9 +38,12 @@ def bai3():
     print("Kết quả cuối cùng:", total)
 
 # Bai 4
+# BAI4.scan_file(path) / BAI4.matching_lines(path) kiểm tra cả file lớn trong một lượt.
+BAI4 = KeywordSet(["Python", "Programming"])
+
 def bai4():
     text = input("Nhập chuỗi cần kiểm tra: ")
-    if "Python" in text and "Programming" in text:
+    if BAI4.check(text):
         print("Chuỗi chứa cả 'Python' và 'Programming'.")
     else:
         print("Chuỗi KHÔNG chứa đủ hai từ.")
@@ -0,0 +1,429 @@
+"""
+Benchmark harness for the practice-problem solutions.
+
+Every problem_* function and every class with an entry in CASES (plus the bai*
+exercises of SOT381-PYTHON.py) is timed at a ladder of input sizes. From the
+timings an empirical complexity class is fitted. Results are written as JSON
+and can be compared against a stored baseline; a slowdown beyond the tolerance
+makes the run exit with status 1.
+
+Usage:
+    python benchmark.py                               # run all, write bench_results.json
+    python benchmark.py -k 3_6 -k 9_2                 # only names containing 3_6 or 9_2
+    python benchmark.py --save-baseline baseline.json
+    python benchmark.py --baseline baseline.json      # fail on regressions
+    python benchmark.py --import-time                 # cold-start cost, lazy vs eager import
+
+Input sizes mean different things per function (the integer itself for number
+problems, the length for strings/lists, the side for matrices); see CASES.
+"""
+import argparse
+import builtins
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from math import exp, log
+from typing import Callable, Dict, List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CONSOLE_SOURCES = ['SOT381-PYTHON.py']
+
+GEOMETRIC = [16, 64, 256, 1024, 4096, 16384, 65536]
+SMALL = [4, 8, 16, 32, 64, 128, 256]
+LINEAR = [10, 12, 14, 16, 18, 20, 22, 24]
+
+# fn: callable to time, make: size -> args tuple, sizes: ladder,
+# fresh: rebuild args before every call (for functions that mutate their input)
+Case = namedtuple('Case', 'fn make sizes fresh')
+
+
+def load_module(path: str, name: str):
+    """Import a source file by path (the file names are not valid module names)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover(modules) -> Dict[str, Callable]:
+    """Collect problem_*/bai* functions and the CASES classes defined in the given modules.
+    Other classes (result types such as TriangleBatch) have no meaningful default input."""
+    found = {}
+    for module in modules:
+        for name, obj in vars(module).items():
+            if getattr(obj, '__module__', None) != module.__name__:
+                continue
+            if inspect.isfunction(obj) and (name.startswith('problem_') or name.startswith('bai')):
+                found[name] = obj
+            elif inspect.isclass(obj) and name in CASES:
+                found[name] = obj
+    return found
+
+
+# ---------------------
+# Input generators
+# ---------------------
+_rng = random.Random(12345)
+
+def _text(n: int) -> str:
+    alphabet = string.ascii_letters + string.digits + '    '
+    return ''.join(_rng.choice(alphabet) for _ in range(n))
+
+def _ints(n: int) -> List[int]:
+    return [_rng.randint(-n, n) for _ in range(n)]
+
+def _names(n: int) -> List[str]:
+    first = ['Nguyen', 'Tran', 'Le', 'Pham', 'Hoang']
+    last = ['An', 'Binh', 'Chi', 'Dung', 'Hoa']
+    return [f"{_rng.choice(first)} Van {_rng.choice(last)}" for _ in range(n)]
+
+def _matrix(n: int) -> List[List[int]]:
+    return [[_rng.randint(0, 9) for _ in range(n)] for _ in range(n)]
+
+def _dict(n: int) -> dict:
+    return {f"k{i}": _rng.randint(0, n) for i in range(n)}
+
+def _value_for(param: inspect.Parameter, n: int):
+    ann = param.annotation
+    if ann is str:
+        return _text(n)
+    if ann is float:
+        return float(n)
+    if ann is set:
+        return set(_ints(n))
+    if ann is dict:
+        return _dict(n)
+    if ann is List[List[int]]:
+        return _matrix(n)
+    if ann is List[str]:
+        return _names(n)
+    if getattr(ann, '__origin__', None) is list:
+        return _ints(n)
+    return n
+
+
+def default_case(fn: Callable) -> Case:
+    """Build a case from the signature: numbers scale with n, containers have n items."""
+    params = [p for p in inspect.signature(fn).parameters.values() if p.default is p.empty]
+    if not params:
+        return Case(fn, lambda n: (), [1, 2, 4], False)
+    return Case(fn, lambda n: tuple(_value_for(p, n) for p in params), GEOMETRIC, False)
+
+
+_tmpdir = None
+
+def _tmp_path(name: str) -> str:
+    global _tmpdir
+    if _tmpdir is None:
+        _tmpdir = tempfile.mkdtemp(prefix='bench_')
+    return os.path.join(_tmpdir, name)
+
+def _number_file(n: int) -> Tuple[str, str]:
+    path = _tmp_path(f"nums_{n}.txt")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(' '.join(str(x) for x in _ints(n)))
+    return path, _tmp_path('out.txt')
+
+def _text_file(n: int) -> Tuple[str, str]:
+    path = _tmp_path(f"text_{n}.txt")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_text(n))
+    return path, _tmp_path('out.txt')
+
+
+def _console(fn: Callable) -> Callable:
+    """Wrap an input()/print() exercise so it can be timed: feed input, drop output."""
+    def run(answer: str):
+        real_input = builtins.input
+        builtins.input = lambda prompt='': answer
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                fn()
+        finally:
+            builtins.input = real_input
+    return run
+
+
+def _scalar(make):
+    return lambda fn: Case(fn, make, GEOMETRIC, False)
+
+def _range_ab(fn):
+    return Case(fn, lambda n: (1, n), GEOMETRIC, False)
+
+# Overrides for functions whose signature alone does not give a meaningful input.
+CASES: Dict[str, Callable[[Callable], Case]] = {
+    'problem_2_18_next_prev_date': _scalar(lambda n: (28, 2, n)),
+    'problem_3_1_sum_range': _range_ab,
+    'problem_3_2_sum_odd_squares': _range_ab,
+    'problem_3_13_power': _scalar(lambda n: (1.000001, n)),
+    'problem_3_14_draw_shapes': lambda fn: Case(fn, lambda n: ('square', n), SMALL, False),
+    'problem_3_18_floyd_triangle': lambda fn: Case(fn, lambda n: (n,), SMALL, False),
+    'problem_4_3_primes_in_range': _range_ab,
+    'problem_4_5_hanoi_moves': lambda fn: Case(fn, lambda n: (n,), LINEAR, False),
+    'problem_4_9_fibonacci_recursive': lambda fn: Case(fn, lambda n: (n,), LINEAR, False),
+    'problem_4_14_recursive_sum': lambda fn: Case(fn, lambda n: (1, n), [16, 32, 64, 128, 256, 512], False),
+    'problem_5_4_insert_between': _scalar(lambda n: (_text(n), _text(n), '-')),
+    'problem_5_5_count_name': _scalar(lambda n: (_names(n), 'Tran Van An')),
+    'problem_5_7_count_same_firstname': _scalar(lambda n: (_names(n), 'An')),
+    'problem_5_8_count_char': _scalar(lambda n: (_text(n), 'a')),
+    'problem_5_11_caesar_cipher': _scalar(lambda n: (_text(n), 3)),
+    'problem_6_1_sum_odd_from_file': _scalar(_number_file),
+    'problem_6_2_filter_numbers_from_text': _scalar(_text_file),
+    'problem_6_3_count_lines_words_chars': _scalar(lambda n: _text_file(n)[:1]),
+    'problem_7_7_add_matrices': lambda fn: Case(fn, lambda n: (_matrix(n), _matrix(n)), SMALL, False),
+    'problem_7_8_print_people_info': _scalar(lambda n: ([{'name': 'A', 'age': 20, 'gender': 'M', 'hometown': 'HN'}] * n,)),
+    'problem_7_9_basic_sort': lambda fn: Case(fn, lambda n: (_ints(n),), SMALL + [512, 1024], False),
+    'problem_7_10_linear_search': _scalar(lambda n: (_ints(n), n + 1)),
+    'problem_7_11_matrix_diagonal_sums': lambda fn: Case(fn, lambda n: (_matrix(n),), SMALL, False),
+    'problem_7_12_matrix_multiply': lambda fn: Case(fn, lambda n: (_matrix(n), _matrix(n)), [4, 8, 16, 32, 64], False),
+    'problem_7_14_insert_at': _scalar(lambda n: (_ints(n), n // 2, 0)),
+    'problem_7_15_remove_value': _scalar(lambda n: (_ints(n), 0)),
+    'problem_7_17_is_symmetric_matrix': lambda fn: Case(fn, lambda n: ([[1] * n for _ in range(n)],), SMALL, False),
+    'problem_7_18_row_col_max': lambda fn: Case(fn, lambda n: (_matrix(n),), SMALL, False),
+    'problem_8_2_student_dict': _scalar(lambda n: ([('An', 20, '10A')] * n,)),
+    'problem_8_4_simple_translate': _scalar(lambda n: (_text(n), {'a': 'b'})),
+    'problem_8_7_remove_duplicate_keys': lambda fn: Case(fn, lambda n: (_dict(n), _dict(n // 2)), GEOMETRIC, True),
+    'problem_9_2_unique_elements': lambda fn: Case(fn, lambda n: (_ints(n),), SMALL + [512, 1024, 2048], False),
+    # classes: time construction plus the main method
+    'Polygon': _scalar(lambda n: ([1.0] * n,)),
+    'Triangle': lambda cls: Case(lambda n: cls(3.0 * n, 4.0 * n, 5.0 * n).area(), lambda n: (n,), GEOMETRIC, False),
+    'Student': lambda cls: Case(lambda s: cls('An', s).average(), lambda n: ([7.5] * n,), GEOMETRIC, False),
+    'Fraction': lambda cls: Case(lambda n: str(cls(n * 6, n * 4)), lambda n: (n,), GEOMETRIC, False),
+    'Circle': lambda cls: Case(lambda n: cls(n).volume_of_cylinder(n), lambda n: (n,), GEOMETRIC, False),
+    'Car': lambda cls: Case(lambda n: cls(n).decelerate(1.0), lambda n: (n,), GEOMETRIC, False),
+    'ComplexNumber': lambda cls: Case(lambda n: str(cls(n, n) + cls(1, 1)), lambda n: (n,), GEOMETRIC, False),
+    'Employee': lambda cls: Case(lambda n: cls('An', n).net_salary(0.1), lambda n: (n,), GEOMETRIC, False),
+    'Animal': lambda cls: Case(lambda: cls().speak(), lambda n: (), [1, 2, 4], False),
+    'Dog': lambda cls: Case(lambda: cls().speak(), lambda n: (), [1, 2, 4], False),
+    'Cat': lambda cls: Case(lambda: cls().speak(), lambda n: (), [1, 2, 4], False),
+    'Point2D': lambda cls: Case(lambda n: str(cls(n, n)), lambda n: (n,), GEOMETRIC, False),
+    'IntSet': lambda cls: Case(lambda a, b: (a | b, a & b), lambda n: (cls(_ints(n)), cls(_ints(n))), GEOMETRIC, False),
+    # SOT381 console exercises
+    'bai1': lambda fn: Case(_console(fn), lambda n: (str(n),), GEOMETRIC, False),
+    'bai2': lambda fn: Case(_console(fn), lambda n: ('',), [1, 2, 4], False),
+    'bai3': lambda fn: Case(_console(fn), lambda n: ('',), [1, 2, 4], False),
+    'bai4': lambda fn: Case(_console(fn), lambda n: (_text(n),), GEOMETRIC, False),
+}
+
+
+def build_case(name: str, obj: Callable) -> Case:
+    if name in CASES:
+        return CASES[name](obj)
+    return default_case(obj)
+
+
+# ---------------------
+# Timing and fitting
+# ---------------------
+def time_call(case: Case, n: int, min_time: float, repeat: int = 3) -> float:
+    """Best-of-`repeat` seconds per call at size n."""
+    fn = case.fn
+    best = float('inf')
+    if case.fresh:
+        for _ in range(repeat):
+            total, loops = 0.0, 0
+            while total < min_time:
+                args = case.make(n)
+                t0 = time.perf_counter()
+                fn(*args)
+                total += time.perf_counter() - t0
+                loops += 1
+            best = min(best, total / loops)
+        return best
+    args = case.make(n)
+    loops = 1
+    while True:  # grow the loop count until one batch takes min_time
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn(*args)
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or elapsed * 2 > min_time * repeat:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn(*args)
+        best = min(best, (time.perf_counter() - t0) / loops)
+    return best
+
+
+def run_case(case: Case, min_time: float, max_call: float) -> dict:
+    """Time a case over its size ladder; stop climbing once a call exceeds max_call."""
+    sizes, times = [], []
+    status = 'ok'
+    for n in case.sizes:
+        try:
+            t = time_call(case, n, min_time)
+        except Exception as e:
+            status = f"error at n={n}: {type(e).__name__}: {e}"
+            break
+        sizes.append(n)
+        times.append(t)
+        if t > max_call:
+            break
+    result = {'sizes': sizes, 'times': times, 'status': status}
+    result['complexity'] = fit_complexity(sizes, times)
+    return result
+
+
+# name -> log f(n); listed from cheapest to most expensive
+MODELS = [
+    ('O(1)', lambda n: 0.0),
+    ('O(log n)', lambda n: log(log(n) + 1)),
+    ('O(n)', lambda n: log(n)),
+    ('O(n log n)', lambda n: log(n) + log(log(n) + 1)),
+    ('O(n^2)', lambda n: 2 * log(n)),
+    ('O(n^3)', lambda n: 3 * log(n)),
+    ('O(2^n)', lambda n: n * log(2)),
+]
+
+def fit_complexity(sizes: List[int], times: List[float]) -> str:
+    """Pick the model for which t / f(n) is most nearly constant (least log-variance)."""
+    if len(sizes) < 3 or len(set(sizes)) < 3:
+        return 'n/a'
+    logs_t = [log(max(t, 1e-12)) for t in times]
+    best_name, best_score = None, float('inf')
+    for name, logf in MODELS:
+        diffs = [lt - logf(n) for lt, n in zip(logs_t, sizes)]
+        mean = sum(diffs) / len(diffs)
+        score = sum((d - mean) ** 2 for d in diffs) / len(diffs)
+        # a more expensive model must be clearly better to win
+        if score < best_score * 0.8:
+            best_name, best_score = name, score
+    return best_name
+
+
+# ---------------------
+# Import (cold start) time
+# ---------------------
+IMPORT_SCENARIOS = {
+    'all sections (old single file)': "import tin_a; tin_a.sections()",
+    'import tin_a': "import tin_a",
+    'import tin_a + one function': "import tin_a; tin_a.problem_3_6_count_primes_less_than",
+}
+
+def import_times(repeat: int = 7) -> Dict[str, float]:
+    """Median seconds to run each import scenario in a fresh interpreter."""
+    child = "import time; t0 = time.perf_counter(); {}; print(time.perf_counter() - t0)"
+    times = {}
+    for label, stmt in IMPORT_SCENARIOS.items():
+        samples = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, '-c', child.format(stmt)], cwd=HERE,
+                                 capture_output=True, text=True, check=True).stdout
+            samples.append(float(out))
+        times[label] = statistics.median(samples)
+    return times
+
+
+# ---------------------
+# Baseline comparison
+# ---------------------
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Return a line for every function slower than baseline by more than tolerance."""
+    regressions = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base or cur['status'] != 'ok':
+            continue
+        base_times = dict(zip(base['sizes'], base['times']))
+        ratios = [t / base_times[n] for n, t in zip(cur['sizes'], cur['times'])
+                  if base_times.get(n)]
+        if not ratios:
+            continue
+        # geometric mean over the shared sizes
+        ratio = exp(sum(log(r) for r in ratios) / len(ratios))
+        cur['baseline_ratio'] = ratio
+        if ratio > 1.0 + tolerance:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline "
+                               f"({base.get('complexity')} -> {cur['complexity']})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-k', dest='patterns', action='append', default=[],
+                        help='only run names containing this substring (repeatable)')
+    parser.add_argument('-o', '--output', default='bench_results.json')
+    parser.add_argument('--baseline', help='baseline JSON to compare against')
+    parser.add_argument('--save-baseline', help='also write results to this path')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slowdown vs baseline, 0.5 == 50%% (default)')
+    parser.add_argument('--min-time', type=float, default=0.01,
+                        help='minimum seconds per timing batch')
+    parser.add_argument('--max-call', type=float, default=0.05,
+                        help='stop the size ladder once one call takes longer')
+    parser.add_argument('--import-time', action='store_true',
+                        help='only measure package import time')
+    args = parser.parse_args(argv)
+
+    meta = {'python': platform.python_version(), 'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    if args.import_time:
+        times = import_times()
+        eager = times['all sections (old single file)']
+        for label, t in times.items():
+            print(f"{label:35s} {t * 1e3:8.2f} ms  ({eager / t:5.1f}x)")
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'meta': meta, 'import_time': times}, f, indent=2)
+        return 0
+
+    import tin_a
+    modules = tin_a.sections()
+    modules += [load_module(os.path.join(HERE, src), f"bench_src_{i}")
+                for i, src in enumerate(CONSOLE_SOURCES)]
+    targets = discover(modules)
+    if args.patterns:
+        targets = {k: v for k, v in targets.items() if any(p in k for p in args.patterns)}
+
+    results = {}
+    try:
+        for name, obj in targets.items():
+            results[name] = run_case(build_case(name, obj), args.min_time, args.max_call)
+            r = results[name]
+            last = f"{r['times'][-1] * 1e6:10.1f} us @ n={r['sizes'][-1]}" if r['times'] else ''
+            print(f"{name:45s} {r['complexity']:11s} {last}"
+                  + ('' if r['status'] == 'ok' else f"  [{r['status']}]"))
+    finally:
+        if _tmpdir:
+            shutil.rmtree(_tmpdir, ignore_errors=True)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f)['results'], args.tolerance)
+
+    report = {
+        'meta': meta,
+        'results': results,
+        'regressions': regressions,
+    }
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if regressions:
+        print('\nRegressions:')
+        for line in regressions:
+            print('  ' + line)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+Opt-in instrumentation for the practice-problem modules.
+
+instrument_module() replaces every public function of a module with a thin
+wrapper that records call count, errors, cumulative time and a latency
+histogram. Because the module attribute itself is replaced, callers (and calls
+between functions of the same module) go through the wrapper without any
+change at the call site. uninstrument_module() puts the originals back, so the
+disabled state costs nothing; registry.enabled = False is a cheaper toggle that
+leaves the wrappers installed but skips the timing.
+
+Example:
+    import tin_a, instrument
+    for section in tin_a.sections():
+        instrument.instrument_module(section)
+    tin_a.problem_3_6_count_primes_less_than(10000)
+    print(instrument.REGISTRY.to_prometheus())
+
+Every loaded tin_a module that holds a replaced function under the same name
+(the package's attribute cache, sections that import from each other) is
+pointed at the same wrapper, so calls between sections are recorded as well.
+Functions a module re-exports from tin_a, like those of the legacy solutions
+file, are wrapped in the same way under the defining section's name; calls
+through either module are recorded once.
+
+Cumulative time of a recursive function includes its nested calls (like the
+cumtime column of cProfile).
+"""
+import functools
+import inspect
+import json
+import sys
+import threading
+from bisect import bisect_left
+from time import perf_counter_ns
+from typing import Dict, List, Tuple
+
+# Upper bounds of the latency buckets in seconds (last bucket is +Inf).
+BUCKETS: Tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+_BUCKETS_NS = [int(b * 1e9) for b in BUCKETS]
+# re-exported functions are only followed into this package (not into math, collections, ...)
+PACKAGE = 'tin_a'
+
+
+class Stats:
+    """Counters for one function."""
+    __slots__ = ('calls', 'errors', 'total_ns', 'max_ns', 'buckets', 'lock')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def record(self, elapsed_ns: int, failed: bool):
+        with self.lock:
+            self.calls += 1
+            self.errors += failed
+            self.total_ns += elapsed_ns
+            if elapsed_ns > self.max_ns:
+                self.max_ns = elapsed_ns
+            self.buckets[bisect_left(_BUCKETS_NS, elapsed_ns)] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_seconds': self.total_ns / 1e9,
+            'mean_seconds': self.total_ns / 1e9 / self.calls if self.calls else 0.0,
+            'max_seconds': self.max_ns / 1e9,
+            'buckets': dict(zip([str(b) for b in BUCKETS] + ['+Inf'], self.buckets)),
+        }
+
+
+class Registry:
+    """Collection of Stats keyed by qualified function name."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.stats: Dict[str, Stats] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Stats:
+        with self._lock:
+            if name not in self.stats:
+                self.stats[name] = Stats()
+            return self.stats[name]
+
+    def reset(self):
+        with self._lock:
+            for s in self.stats.values():
+                with s.lock:
+                    s.clear()
+
+    def wrap(self, fn, name: str = None):
+        """Return a timing wrapper around fn; fn is reachable as wrapper.__wrapped__."""
+        name = name or f"{fn.__module__}.{fn.__qualname__}"
+        record = self.get(name).record
+        registry = self
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return fn(*args, **kwargs)
+            failed = True
+            t0 = perf_counter_ns()
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                record(perf_counter_ns() - t0, failed)
+        wrapper._instrument_registry = self
+        return wrapper
+
+    def top(self, n: int = 10) -> List[Tuple[str, dict]]:
+        """The n functions with the highest cumulative time."""
+        ranked = sorted(self.stats.items(), key=lambda kv: kv[1].total_ns, reverse=True)
+        return [(name, s.as_dict()) for name, s in ranked[:n] if s.calls]
+
+    def to_dict(self) -> dict:
+        return {name: s.as_dict() for name, s in self.stats.items() if s.calls}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, prefix: str = 'tin_a') -> str:
+        """Prometheus text exposition format (counters plus a histogram)."""
+        lines = [
+            f"# HELP {prefix}_calls_total Number of calls per function.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        items = [(name, s) for name, s in sorted(self.stats.items()) if s.calls]
+        for name, s in items:
+            lines.append(f'{prefix}_calls_total{{function="{name}"}} {s.calls}')
+        lines += [f"# HELP {prefix}_errors_total Calls that raised an exception.",
+                  f"# TYPE {prefix}_errors_total counter"]
+        for name, s in items:
+            lines.append(f'{prefix}_errors_total{{function="{name}"}} {s.errors}')
+        lines += [f"# HELP {prefix}_call_seconds Call latency.",
+                  f"# TYPE {prefix}_call_seconds histogram"]
+        for name, s in items:
+            cumulative = 0
+            for bound, count in zip(list(BUCKETS) + ['+Inf'], s.buckets):
+                cumulative += count
+                lines.append(f'{prefix}_call_seconds_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_call_seconds_sum{{function="{name}"}} {s.total_ns / 1e9}')
+            lines.append(f'{prefix}_call_seconds_count{{function="{name}"}} {s.calls}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+def _package_modules():
+    return [m for n, m in list(sys.modules.items())
+            if m is not None and (n == PACKAGE or n.startswith(PACKAGE + '.'))]
+
+
+def _rebind(module, name: str, old, new):
+    """Point module.name, and every loaded tin_a module still holding old as name, at new."""
+    setattr(module, name, new)
+    for m in _package_modules():
+        if m is not module and vars(m).get(name) is old:
+            setattr(m, name, new)
+
+
+def _home(fn):
+    """The tin_a module defining fn, or None for helpers imported from elsewhere (sqrt, ...)."""
+    if not fn.__module__.startswith(PACKAGE + '.'):
+        return None
+    return sys.modules.get(fn.__module__)
+
+
+def instrument_module(module, registry: Registry = None) -> List[str]:
+    """Wrap every public function of module in place. Returns the wrapped names.
+    Functions re-exported from tin_a are wrapped under their section's name."""
+    registry = registry or REGISTRY
+    wrapped = []
+    for name, fn in list(vars(module).items()):
+        if name.startswith('_') or not inspect.isfunction(fn) or hasattr(fn, '_instrument_registry'):
+            continue
+        if fn.__module__ == module.__name__:
+            home = module
+        else:
+            home = _home(fn)
+            if home is None:
+                continue
+            current = vars(home).get(name)
+            if hasattr(current, '_instrument_registry') and current.__wrapped__ is fn:
+                _rebind(module, name, fn, current)  # the section is already instrumented
+                wrapped.append(name)
+                continue
+        _rebind(module, name, fn, registry.wrap(fn, f"{home.__name__}.{name}"))
+        wrapped.append(name)
+    return wrapped
+
+
+def uninstrument_module(module) -> List[str]:
+    """Restore the original functions replaced by instrument_module(), everywhere they were rebound."""
+    restored = []
+    for name, obj in list(vars(module).items()):
+        if hasattr(obj, '_instrument_registry'):
+            _rebind(module, name, obj, obj.__wrapped__)
+            restored.append(name)
+    return restored
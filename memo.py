@@ -0,0 +1,212 @@
+"""
+Bounded memoization for the pure problem functions.
+
+memoize() is a decorator with LRU eviction (maxsize), optional expiry (ttl in
+seconds), hit/miss/eviction counters and a lock so it is safe across threads.
+Passing store=DiskStore(path) adds a sqlite-backed second tier so a warm cache
+survives process restarts.
+
+apply() memoizes selected functions of a module or of the tin_a package in
+place (the same way instrument.instrument_module works), e.g.
+
+    import tin_a, memo
+    memo.apply(tin_a, memo.PURE_FUNCTIONS, maxsize=4096, store=memo.DiskStore('cache.sqlite'))
+
+Only use it for functions whose result depends on the arguments alone. Calls
+with unhashable arguments bypass the cache. list/dict/set results are copied
+on the way out so callers cannot mutate the cached value.
+"""
+import copy
+import functools
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Iterable, List
+
+PURE_FUNCTIONS = [
+    'problem_3_5_is_perfect',
+    'problem_3_9_prime_factorization',
+    'problem_3_12_list_divisors',
+    'problem_3_17_is_armstrong',
+    'problem_2_9_triangle_type',
+]
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions disk_hits size maxsize')
+
+_MISSING = object()
+
+
+class _KwargsMark:
+    """Separates positional from keyword arguments in cache keys (like functools._make_key)."""
+    __slots__ = ()
+
+    def __repr__(self):  # stable across processes, so disk keys stay valid
+        return '<kwargs>'
+
+
+_KWARGS = _KwargsMark()
+
+
+class DiskStore:
+    """Persistent key -> value table in a sqlite file, shared by all memoized functions."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS memo '
+                         '(key TEXT PRIMARY KEY, value BLOB, expires REAL)')
+        self._db.commit()
+
+    def get(self, key: str):
+        return self.get_entry(key)[0]
+
+    def get_entry(self, key: str):
+        """(value, expires) where expires is a time.time() deadline or None; (_MISSING, None) if absent."""
+        with self._lock:
+            row = self._db.execute('SELECT value, expires FROM memo WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return _MISSING, None
+        value, expires = row
+        if expires is not None and expires < time.time():
+            self.delete(key)
+            return _MISSING, None
+        return pickle.loads(value), expires
+
+    def set(self, key: str, value, ttl: float = None):
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO memo VALUES (?, ?, ?)',
+                             (key, pickle.dumps(value), expires))
+            self._db.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._db.execute('DELETE FROM memo WHERE key = ?', (key,))
+            self._db.commit()
+
+    def clear(self, prefix: str = ''):
+        with self._lock:
+            self._db.execute('DELETE FROM memo WHERE key LIKE ?', (prefix + '%',))
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def memoize(maxsize: int = 1024, ttl: float = None, store: DiskStore = None):
+    """Decorator: LRU cache of at most maxsize entries, each valid for ttl seconds (None = forever)."""
+    if maxsize is not None and maxsize <= 0:
+        raise ValueError('maxsize must be positive')
+
+    def decorator(fn):
+        cache = OrderedDict()  # key -> (expires_at or None, value)
+        lock = threading.RLock()
+        stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'disk_hits': 0}
+        prefix = f"{fn.__module__}.{fn.__qualname__}:"
+
+        def lookup(key):
+            with lock:
+                entry = cache.get(key, _MISSING)
+                if entry is _MISSING:
+                    return _MISSING
+                expires, value = entry
+                if expires is not None and expires < time.monotonic():
+                    del cache[key]
+                    stats['evictions'] += 1
+                    return _MISSING
+                cache.move_to_end(key)
+                stats['hits'] += 1
+                return value
+
+        def insert(key, value, lifetime=ttl):
+            expires = time.monotonic() + lifetime if lifetime is not None else None
+            with lock:
+                cache[key] = (expires, value)
+                cache.move_to_end(key)
+                while maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    stats['evictions'] += 1
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS,) + tuple(sorted(kwargs.items())) if kwargs else args
+            try:
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)
+            value = lookup(key)
+            if value is _MISSING:
+                disk_key = prefix + repr(key) if store is not None else None
+                value, disk_expires = store.get_entry(disk_key) if store is not None else (_MISSING, None)
+                lifetime = ttl
+                if disk_expires is not None:
+                    # keep the disk deadline instead of starting a fresh ttl
+                    lifetime = max(0.0, disk_expires - time.time())
+                with lock:
+                    if value is _MISSING:
+                        stats['misses'] += 1
+                    else:
+                        stats['disk_hits'] += 1
+                if value is _MISSING:
+                    # computed outside the lock; concurrent misses may compute twice
+                    value = fn(*args, **kwargs)
+                    if store is not None:
+                        store.set(disk_key, value, ttl)
+                insert(key, value, lifetime)
+            if isinstance(value, (list, dict, set)):
+                return copy.copy(value)
+            return value
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(stats['hits'], stats['misses'], stats['evictions'],
+                                 stats['disk_hits'], len(cache), maxsize)
+
+        def cache_clear(disk: bool = False):
+            with lock:
+                cache.clear()
+                for k in stats:
+                    stats[k] = 0
+            if disk and store is not None:
+                store.clear(prefix)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+def _rebind(module, name: str, old, new):
+    """Point module.name, and the name in the module defining old, at new."""
+    setattr(module, name, new)
+    home = sys.modules.get(old.__module__)
+    if home is not None and home is not module and getattr(home, name, None) is old:
+        setattr(home, name, new)
+
+
+def apply(module, names: Iterable[str] = PURE_FUNCTIONS, **options) -> List[str]:
+    """Memoize the named functions of module in place; options go to memoize()."""
+    done = []
+    for name in names:
+        fn = getattr(module, name)
+        if hasattr(fn, 'cache_info'):
+            continue
+        _rebind(module, name, fn, memoize(**options)(fn))
+        done.append(name)
+    return done
+
+
+def unapply(module, names: Iterable[str] = PURE_FUNCTIONS) -> List[str]:
+    """Undo apply() for the named functions."""
+    done = []
+    for name in names:
+        fn = getattr(module, name)
+        if hasattr(fn, 'cache_info'):
+            _rebind(module, name, fn, fn.__wrapped__)
+            done.append(name)
+    return done
@@ -0,0 +1,24 @@
+import pytest
+
+from tin_a.sets import IntSet
+
+
+@pytest.mark.parametrize('gap', [10 ** 9, 10 ** 12, 10 ** 20])
+def test_far_apart_dense_operands(gap):
+    a, b = IntSet({0, 1, 2}), IntSet({gap, gap + 1})
+    assert a & b == IntSet()
+    assert a | b == {0, 1, 2, gap, gap + 1}
+    assert a ^ b == {0, 1, 2, gap, gap + 1}
+    assert a - b == a
+    assert b - a == b
+    assert {0, 1} - b == {0, 1}
+    assert a.isdisjoint(b)
+    assert not a <= b
+
+
+def test_compare_with_non_integer_set():
+    assert not IntSet({1}) == {1, 'a'}
+    assert not {1, 'a'} == IntSet({1})
+    assert IntSet({1}) != {1, 'a'}
+    assert IntSet({1}) < {1, 'a'}
+    assert {1, 'a'} >= IntSet({1})
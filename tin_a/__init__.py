@@ -0,0 +1,147 @@
+"""
+Python solutions for the practice problems list provided by the user.
+Each exercise is implemented as a function named according to the section and number,
+e.g. problem_1_1(), problem_2_3(), etc.
+
+The solutions are split into one submodule per section (tin_a.basic_io,
+tin_a.branching, ... tin_a.oop). Submodules are imported lazily: `import tin_a`
+only loads this file, and the first access to tin_a.problem_3_6_... imports
+tin_a.loops alone.
+
+Problems can also be looked up by ID:
+    tin_a.get_problem('3_6')(100)           # problem_3_6_count_primes_less_than
+    tin_a.get_problem('1_1_f_to_c')(212)    # IDs shared by two functions need the suffix
+
+Note: Some problem statements in the list were ambiguous. In those cases the
+implementation makes a reasonable assumption (documented in function docstrings).
+"""
+import importlib
+
+SECTIONS = {
+    1: 'basic_io',
+    2: 'branching',
+    3: 'loops',
+    4: 'functions',
+    5: 'strings',
+    6: 'file_io',
+    7: 'lists',
+    8: 'dicts',
+    9: 'sets',
+    10: 'oop',
+}
+
+# Public names that do not follow the problem_<section>_<n>_... pattern.
+_EXTRA = {
+    'days_in_month': 'branching',
+    'date_to_ordinal': 'branching',
+    'ordinal_to_date': 'branching',
+    'add_days': 'branching',
+    'days_between': 'branching',
+    'weekday': 'branching',
+    'dates_to_ordinals': 'branching',
+    'ordinals_to_dates': 'branching',
+    'classify_triangles': 'branching',
+    'TRIANGLE_TYPES': 'branching',
+    'ANGLE_TYPES': 'branching',
+    'IntSet': 'sets',
+    'Polygon': 'oop',
+    'Triangle': 'oop',
+    'Student': 'oop',
+    'Fraction': 'oop',
+    'Circle': 'oop',
+    'Car': 'oop',
+    'ComplexNumber': 'oop',
+    'Employee': 'oop',
+    'Animal': 'oop',
+    'Dog': 'oop',
+    'Cat': 'oop',
+    'Point2D': 'oop',
+}
+
+# problem ID ('3_6', or '1_1_c_to_f' where the number is shared) -> (module, name).
+# Functions are read off the module at lookup time, so wrappers installed later
+# by memo.apply / instrument.instrument_module are seen by get_problem().
+# (typing is not imported here: it alone costs more than loading this package.)
+_registry = {}
+_ambiguous = {}
+_registered = set()
+
+
+def _load(submodule: str):
+    module = importlib.import_module(f"{__name__}.{submodule}")
+    if submodule not in _registered:
+        _register(module)
+    return module
+
+
+def _register(module):
+    by_id = {}
+    for name, obj in vars(module).items():
+        if name.startswith('problem_') and getattr(obj, '__module__', None) == module.__name__:
+            pid = '_'.join(name.split('_')[1:3])
+            by_id.setdefault(pid, []).append(name)
+    for pid, names in by_id.items():
+        if len(names) == 1:
+            _registry[pid] = (module, names[0])
+        else:
+            _ambiguous[pid] = sorted(names)
+            for name in names:
+                _registry[name[len('problem_'):]] = (module, name)
+    _registered.add(module.__name__.rsplit('.', 1)[-1])
+
+
+def _section_of(name: str):
+    if name.startswith('problem_'):
+        try:
+            return SECTIONS.get(int(name.split('_')[1]))
+        except (IndexError, ValueError):
+            return None
+    return _EXTRA.get(name)
+
+
+def __getattr__(name: str):
+    if name in SECTIONS.values():
+        return _load(name)
+    submodule = _section_of(name)
+    if submodule is not None:
+        module = _load(submodule)
+        if hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value  # later lookups skip __getattr__
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SECTIONS.values()) | set(_EXTRA))
+
+
+def sections() -> list:
+    """Import and return every section module (in section order)."""
+    return [_load(name) for name in SECTIONS.values()]
+
+
+def get_problem(problem_id: str):
+    """Return the function for an ID such as '3_6' (a full problem_* name also works).
+    Raises KeyError for unknown or ambiguous IDs; only the needed section is imported."""
+    pid = problem_id[len('problem_'):] if problem_id.startswith('problem_') else problem_id
+    submodule = _section_of('problem_' + pid)
+    if submodule is None:
+        raise KeyError(f"unknown problem {problem_id!r}")
+    _load(submodule)
+    if pid in _registry:
+        module, name = _registry[pid]
+        return getattr(module, name)
+    if pid in _ambiguous:
+        raise KeyError(f"ambiguous problem {problem_id!r}: {', '.join(_ambiguous[pid])}")
+    # full name with the descriptive suffix, e.g. '3_6_count_primes_less_than'
+    entry = _registry.get('_'.join(pid.split('_')[:2]))
+    if entry is not None and entry[1] == 'problem_' + pid:
+        return getattr(*entry)
+    raise KeyError(f"unknown problem {problem_id!r}")
+
+
+def problems() -> dict:
+    """Full ID -> function registry (imports every section)."""
+    sections()
+    return {pid: getattr(module, name) for pid, (module, name) in _registry.items()}
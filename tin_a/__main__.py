@@ -0,0 +1,7 @@
+"""python -m tin_a --batch INPUT ...: see tin_a.batch."""
+import sys
+
+from .batch import main
+
+if __name__ == '__main__':
+    sys.exit(main())
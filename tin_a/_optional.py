@@ -0,0 +1,14 @@
+"""Optional dependencies, imported on first use so they do not slow down import tin_a."""
+_numpy = False  # module once imported, None if not installed
+
+
+def numpy():
+    """Return the numpy module, or None when it is not installed."""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy as np
+            _numpy = np
+        except ImportError:
+            _numpy = None
+    return _numpy
@@ -0,0 +1,139 @@
+"""Section 1: Basic I/O."""
+from math import pi, sqrt
+from typing import Tuple, List
+
+def problem_1_1_c_to_f(celsius: float) -> float:
+    """Convert Celsius to Fahrenheit. Returns Fahrenheit.
+    Formula: F = C * 9/5 + 32"""
+    return celsius * 9.0/5.0 + 32.0
+
+def problem_1_1_f_to_c(fahrenheit: float) -> float:
+    """Convert Fahrenheit to Celsius. Returns Celsius.
+    Formula: C = (F - 32) * 5/9"""
+    return (fahrenheit - 32.0) * 5.0/9.0
+
+def problem_1_2_div_mod(a: int, b: int) -> Tuple[int,int]:
+    """Return integer division and remainder of a // b and a % b (b>0 assumed).
+    Returns (quotient, remainder)."""
+    if b == 0:
+        raise ValueError("b must be non-zero")
+    return divmod(a, b)
+
+def problem_1_3_area_circle(radius: float) -> float:
+    """Area of circle with radius."""
+    if radius < 0:
+        raise ValueError("radius must be non-negative")
+    return pi * radius * radius
+
+def problem_1_4_freefall_velocity(h: float, g: float=9.81) -> float:
+    """Velocity of falling object from height h, starting at rest, ignoring air resistance.
+    v = sqrt(2*g*h)"""
+    if h < 0:
+        raise ValueError("height must be non-negative")
+    return sqrt(2.0 * g * h)
+
+def problem_1_5_trapezoid_area(a: float, b: float, h: float) -> float:
+    """Area of trapezoid with bases a (big), b (small) and height h."""
+    return (a + b) * h / 2.0
+
+def problem_1_6_triangle_perimeter_area(a: float, b: float, c: float) -> Tuple[float,float]:
+    """Return (perimeter, area) of triangle with side lengths a,b,c using Heron's formula.
+    Raises ValueError if not a triangle."""
+    if a <= 0 or b <= 0 or c <= 0:
+        raise ValueError("sides must be positive")
+    if a + b <= c or a + c <= b or b + c <= a:
+        raise ValueError("not a valid triangle")
+    p = a + b + c
+    s = p / 2.0
+    area = sqrt(s * (s - a) * (s - b) * (s - c))
+    return p, area
+
+def problem_1_7_rectangle_perimeter_area(length: float, width: float) -> Tuple[float,float]:
+    p = 2.0 * (length + width)
+    a = length * width
+    return p, a
+
+def problem_1_8_seconds_to_hms(seconds: int) -> Tuple[int,int,int]:
+    """Convert total seconds to (hours, minutes, seconds)."""
+    if seconds < 0:
+        raise ValueError("seconds must be non-negative")
+    h = seconds // 3600
+    seconds %= 3600
+    m = seconds // 60
+    s = seconds % 60
+    return h, m, s
+
+def problem_1_9_change_breakdown(amount: int, denominations: List[int]=None) -> List[Tuple[int,int]]:
+    """Given amount (integer), return list of (denomination, count) using greedy algorithm.
+    Default denominations (VND-like): [500000,200000,100000,50000,20000,10000,5000,2000,1000,500,200,100]
+    If amount < 0 raises ValueError.
+    """
+    if amount < 0:
+        raise ValueError("amount must be non-negative")
+    if denominations is None:
+        denominations = [500000,200000,100000,50000,20000,10000,5000,2000,1000,500,200,100]
+    result = []
+    remaining = amount
+    for d in denominations:
+        cnt = remaining // d
+        if cnt:
+            result.append((d, cnt))
+            remaining -= d * cnt
+    if remaining:
+        result.append((1, remaining))  # leftover as ones
+    return result
+
+def problem_1_10_mean_three(x: float, y: float, z: float) -> float:
+    return (x + y + z) / 3.0
+
+def problem_1_11_arithmetic_series_sum(a1: float, d: float, n: int) -> float:
+    """Sum of arithmetic progression: n/2 * (2*a1 + (n-1)*d)"""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return n * (2 * a1 + (n - 1) * d) / 2.0
+
+def problem_1_12_decimal_to_binary(n: int) -> str:
+    """Return binary representation as string for integer n (handles negative)."""
+    if n == 0:
+        return "0"
+    sign = ""
+    if n < 0:
+        sign = "-"
+        n = -n
+
+    bits = []
+    while n > 0:
+        bits.append(str(n % 2))
+        n //= 2
+    return sign + ''.join(reversed(bits))
+
+def problem_1_13_distance_points(x1: float, y1: float, x2: float, y2: float) -> float:
+    return sqrt((x1 - x2)**2 + (y1 - y2)**2)
+
+def problem_1_14_electric_bill(kwh: float) -> float:
+    """Calculate tiered electricity bill using a common Vietnamese progressive tariff example.
+    The user referenced a multi-tier scheme elsewhere; here we implement the common 5-tier: 
+    0-50: 1678
+    51-100: 1734
+    101-200: 2014
+    201-350: 2536
+    >350: 2927
+    (units: VND per kWh)
+    """
+    if kwh < 0:
+        raise ValueError("kWh must be non-negative")
+    tiers = [(50, 1678), (50, 1734), (100, 2014), (150, 2536), (float('inf'), 2927)]
+    remaining = kwh
+    total = 0.0
+    for cap, price in tiers:
+        use = min(remaining, cap)
+        total += use * price
+        remaining -= use
+        if remaining <= 0:
+            break
+    return total
+
+def problem_1_15_triangle_area_by_coords(x1,y1,x2,y2,x3,y3) -> float:
+    """Area by shoelace formula."""
+    area = abs(x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2)) / 2.0
+    return area
@@ -0,0 +1,166 @@
+"""
+Batch execution of problem functions from JSON Lines.
+
+Each input line is a record such as
+    {"fn": "problem_3_9_prime_factorization", "args": [360]}
+with optional "kwargs" and "id" keys; "fn" may also be a problem ID ("3_9").
+For every input line one output line is written, in input order:
+    {"id": ..., "ok": true, "result": [2, 2, 2, 3, 3, 5]}
+    {"id": ..., "ok": false, "error": "ValueError: b must be non-zero"}
+Results containing inf or nan are reported as errors, since JSON cannot hold them.
+
+Lines are sent to a process pool in chunks; at most `workers * 2` chunks are
+in flight, so memory stays bounded however long the input is. Per-function
+throughput stats are printed to stderr at the end.
+
+Usage:
+    python -m tin_a --batch jobs.jsonl -o results.jsonl -w 4
+    cat jobs.jsonl | python -m tin_a --batch -
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+_functions = {}  # per-process cache: "fn" field -> (module, attribute name)
+
+
+def resolve(name: str):
+    """Look up a problem function (full name or problem ID) or a helper/class listed in tin_a._EXTRA.
+    The function is read off its module on every call, so memo/instrument wrappers apply."""
+    entry = _functions.get(name)
+    if entry is None:
+        import tin_a
+        if name.startswith('_'):
+            raise KeyError(f"unknown function {name!r}")
+        if name.startswith('problem_') or name[:1].isdigit():
+            fn = tin_a.get_problem(name)
+            entry = (sys.modules[fn.__module__], fn.__name__)
+        else:
+            # only the registered public helpers/classes, never package internals like sections()
+            if name not in tin_a._EXTRA or not callable(getattr(tin_a, name)):
+                raise KeyError(f"unknown function {name!r}")
+            entry = (tin_a, name)
+        _functions[name] = entry
+    return getattr(*entry)
+
+
+def _jsonable(value):
+    if isinstance(value, (set, frozenset)):
+        try:
+            return sorted(value)
+        except TypeError:
+            return list(value)
+    return str(value)
+
+
+def run_chunk(lines: List[str]) -> Tuple[List[str], Dict[str, list]]:
+    """Execute a chunk of JSON lines. Returns (output lines, {fn: [calls, errors, seconds]})."""
+    out = []
+    stats = {}
+    for line in lines:
+        record_id = None
+        name = '<invalid>'
+        t0 = time.perf_counter()
+        try:
+            record = json.loads(line)
+            record_id = record.get('id')
+            name = record['fn']
+            fn = resolve(name)
+            name = getattr(fn, '__name__', name)
+            result = fn(*record.get('args', ()), **record.get('kwargs', {}))
+            # allow_nan=False: inf/nan would be written as bare Infinity/NaN, which is not JSON
+            text = json.dumps({'id': record_id, 'ok': True, 'result': result},
+                              default=_jsonable, ensure_ascii=False, allow_nan=False)
+            failed = False
+        except Exception as e:
+            text = json.dumps({'id': record_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"},
+                              ensure_ascii=False)
+            failed = True
+        entry = stats.setdefault(name, [0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += failed
+        entry[2] += time.perf_counter() - t0
+        out.append(text)
+    return out, stats
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    it = (line for line in lines if line.strip())
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(lines: Iterable[str], out, workers: int = None, chunk_size: int = 1000) -> Dict[str, list]:
+    """Run every JSON line, writing results to the file-like out in input order.
+    workers=0 runs in this process. Returns merged per-function stats."""
+    totals = {}
+
+    def emit(chunk_result):
+        texts, stats = chunk_result
+        out.write('\n'.join(texts) + '\n')
+        for name, (calls, errors, seconds) in stats.items():
+            entry = totals.setdefault(name, [0, 0, 0.0])
+            entry[0] += calls
+            entry[1] += errors
+            entry[2] += seconds
+
+    if workers == 0:
+        for chunk in _chunks(lines, chunk_size):
+            emit(run_chunk(chunk))
+        return totals
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(pool.submit(run_chunk, chunk))
+            if len(pending) >= workers * 2:
+                emit(pending.popleft().result())
+        while pending:
+            emit(pending.popleft().result())
+    return totals
+
+
+def format_stats(totals: Dict[str, list], wall: float) -> str:
+    lines = [f"{'function':45s} {'calls':>9s} {'errors':>7s} {'cpu s':>9s} {'calls/s':>11s}"]
+    for name, (calls, errors, seconds) in sorted(totals.items(), key=lambda kv: -kv[1][2]):
+        rate = calls / seconds if seconds else float('inf')
+        lines.append(f"{name:45s} {calls:9d} {errors:7d} {seconds:9.3f} {rate:11.0f}")
+    total = sum(v[0] for v in totals.values())
+    lines.append(f"{total} calls in {wall:.3f} s wall ({total / wall if wall else 0:.0f} calls/s)")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Run problem functions from JSON Lines.')
+    parser.add_argument('--batch', required=True, metavar='INPUT',
+                        help="JSON Lines file, or '-' for stdin")
+    parser.add_argument('-o', '--output', help='output file (default stdout)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='worker processes (default: CPU count, 0 = no pool)')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not print stats')
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.batch == '-' else open(args.batch, encoding='utf-8')
+    dst = sys.stdout if args.output is None else open(args.output, 'w', encoding='utf-8')
+    t0 = time.perf_counter()
+    try:
+        totals = run_batch(src, dst, args.workers, args.chunk_size)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    if not args.quiet:
+        print(format_stats(totals, time.perf_counter() - t0), file=sys.stderr)
+    return 0
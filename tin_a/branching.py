@@ -0,0 +1,282 @@
+"""Section 2: Branching."""
+from collections import namedtuple
+from math import nan, sqrt
+from typing import Tuple
+from ._optional import numpy as _numpy
+
+def problem_2_1_even_odd(n: int) -> str:
+    return "even" if n % 2 == 0 else "odd"
+
+def problem_2_2_expression(x: float) -> float:
+    """The original expression wasn't given exactly; implement example: y = (x^2 + 2x + 1)/(x+1) if x!=-1
+    If x == -1 raises ZeroDivisionError."""
+    if x == -1:
+        raise ZeroDivisionError("division by zero for this chosen expression")
+    return (x**2 + 2*x + 1) / (x + 1)
+
+def problem_2_3_is_leap_year(year: int) -> bool:
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+def problem_2_4_grade_classification(score: float) -> str:
+    """Return classification string based on score (0-10 scale assumed).
+    Typical Vietnamese scale: >=8: Giỏi, >=6.5: Khá, >=5: TB, else Yếu
+    """
+    if score >= 8.0:
+        return "Giỏi"
+    if score >= 6.5:
+        return "Khá"
+    if score >= 5.0:
+        return "Trung Bình"
+    return "Yếu"
+
+def problem_2_5_solve_linear(a: float, b: float):
+    """Solve ax + b = 0. Return solution or None if infinite/no solutions as tuple.
+    Returns ('one', x) or ('none', None) or ('infinite', None)"""
+    if a == 0:
+        if b == 0:
+            return ('infinite', None)
+        else:
+            return ('none', None)
+    return ('one', -b / a)
+
+def problem_2_6_solve_quadratic(a: float, b: float, c: float):
+    """Solve ax^2 + bx + c = 0. Return tuple: (number_of_roots, roots_list)."""
+    if a == 0:
+        # reduce to linear
+        return problem_2_5_solve_linear(b, c)
+    disc = b*b - 4*a*c
+    if disc < 0:
+        return (0, [])
+    if disc == 0:
+        x = -b / (2*a)
+        return (1, [x])
+    root1 = (-b + sqrt(disc)) / (2*a)
+    root2 = (-b - sqrt(disc)) / (2*a)
+    return (2, [root1, root2])
+
+def problem_2_7_point_in_circle(x: float, y: float, cx: float, cy: float, r: float) -> bool:
+    return (x-cx)**2 + (y-cy)**2 <= r*r
+
+def problem_2_8_solve_quadratic_allcases(a: float, b: float, c: float):
+    """Similar to 2_6 but handles a==0 and returns message style results."""
+    if a == 0:
+        return problem_2_5_solve_linear(b, c)
+    return problem_2_6_solve_quadratic(a,b,c)
+
+def problem_2_9_triangle_type(a: float,b: float,c: float) -> str:
+    """Return triangle type: 'not_triangle', 'equilateral', 'isosceles', 'right', 'right_isosceles', 'scalene'"""
+    if a <=0 or b<=0 or c<=0:
+        return 'not_triangle'
+    if a + b <= c or a + c <= b or b + c <= a:
+        return 'not_triangle'
+    types = []
+    eps = 1e-9
+    # equilateral
+    if abs(a-b) < eps and abs(b-c) < eps:
+        return 'equilateral'
+    # check right
+    sides = sorted([a,b,c])
+    is_right = abs(sides[0]**2 + sides[1]**2 - sides[2]**2) < 1e-9
+    is_isos = abs(a-b) < eps or abs(a-c) < eps or abs(b-c) < eps
+    if is_right and is_isos:
+        return 'right_isosceles'
+    if is_right:
+        return 'right'
+    if is_isos:
+        return 'isosceles'
+    return 'scalene'
+
+def problem_2_10_char_type(ch: str) -> str:
+    if len(ch) == 0:
+        raise ValueError('empty string')
+    c = ch[0]
+    if c.isupper():
+        return 'uppercase'
+    if c.islower():
+        return 'lowercase'
+    if c.isdigit():
+        return 'digit'
+    return 'special'
+
+def problem_2_11_days_in_feb(year: int) -> int:
+    return _days_from_civil(1, 3, year) - _days_from_civil(1, 2, year)
+
+def problem_2_12_can_be_triangle(a: float,b: float,c: float) -> bool:
+    return a>0 and b>0 and c>0 and (a+b>c and a+c>b and b+c>a)
+
+def problem_2_13_max_of_three(a: float,b: float,c: float) -> float:
+    return max(a,b,c)
+
+def problem_2_14_triangle_angle_type(a: float,b: float,c: float) -> str:
+    """Return 'acute', 'right', 'obtuse' for triangle with sides a,b,c."""
+    if not problem_2_12_can_be_triangle(a,b,c):
+        return 'not_triangle'
+    sides = sorted([a,b,c])
+    x,y,z = sides
+    val = x*x + y*y - z*z
+    if abs(val) < 1e-9:
+        return 'right'
+    if val > 0:
+        return 'acute'
+    return 'obtuse'
+
+def problem_2_15_year_days(year: int) -> int:
+    return _days_from_civil(1, 1, year + 1) - _days_from_civil(1, 1, year)
+
+def problem_2_16_quadrant(x: float, y: float) -> int:
+    if x==0 or y==0:
+        return 0  # on axis
+    if x>0 and y>0:
+        return 1
+    if x<0 and y>0:
+        return 2
+    if x<0 and y<0:
+        return 3
+    return 4
+
+def problem_2_17_is_pythagorean_triplet(a:int,b:int,c:int) -> bool:
+    s = sorted([a,b,c])
+    return s[0]**2 + s[1]**2 == s[2]**2
+
+def problem_2_18_next_prev_date(day:int, month:int, year:int) -> Tuple[Tuple[int,int,int], Tuple[int,int,int]]:
+    """Return (next_date, prev_date) as tuples (d,m,y). Basic Gregorian calendar handling."""
+    n = date_to_ordinal(day, month, year)
+    return ordinal_to_date(n + 1), ordinal_to_date(n - 1)
+
+# Date engine: (d, m, y) <-> day ordinal in closed form (proleptic Gregorian).
+# Ordinals match datetime.date.toordinal(), i.e. 1/1/1 is day 1.
+# The arithmetic is branch-free so the same code runs on ints and numpy arrays.
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_EPOCH_SHIFT = 719468   # days from 0000-03-01 to 1970-01-01
+_ORDINAL_SHIFT = 719163 # toordinal() of 1970-01-01 is 719163
+
+def _days_from_civil(d, m, y):
+    y = y - (m <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    mp = (m + 9) % 12
+    doy = (153 * mp + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - _EPOCH_SHIFT + _ORDINAL_SHIFT
+
+def _civil_from_days(n):
+    z = n - _ORDINAL_SHIFT + _EPOCH_SHIFT
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + 3 - 12 * (mp >= 10)
+    y = yoe + era * 400 + (m <= 2)
+    return d, m, y
+
+def days_in_month(month:int, year:int) -> int:
+    if month < 1 or month > 12:
+        raise ValueError('invalid month')
+    if month == 2:
+        return 29 if problem_2_3_is_leap_year(year) else 28
+    return _MONTH_DAYS[month - 1]
+
+def date_to_ordinal(day:int, month:int, year:int) -> int:
+    """Day number of (day, month, year); raises ValueError for an invalid date."""
+    if day < 1 or day > days_in_month(month, year):
+        raise ValueError('invalid day')
+    return _days_from_civil(day, month, year)
+
+def ordinal_to_date(n:int) -> Tuple[int,int,int]:
+    """Inverse of date_to_ordinal, returns (d,m,y)."""
+    d, m, y = _civil_from_days(n)
+    return int(d), int(m), int(y)
+
+def add_days(day:int, month:int, year:int, n:int) -> Tuple[int,int,int]:
+    """Date n days after (d,m,y); n may be negative."""
+    return ordinal_to_date(date_to_ordinal(day, month, year) + n)
+
+def days_between(d1: Tuple[int,int,int], d2: Tuple[int,int,int]) -> int:
+    """Signed number of days from d1 to d2, both given as (d,m,y)."""
+    return date_to_ordinal(*d2) - date_to_ordinal(*d1)
+
+def weekday(day:int, month:int, year:int) -> int:
+    """Day of week, Monday == 0 ... Sunday == 6 (same as datetime)."""
+    return (date_to_ordinal(day, month, year) + 6) % 7
+
+def dates_to_ordinals(days, months, years):
+    """Vectorized date_to_ordinal over equal-length sequences.
+    Returns an int64 numpy array when numpy is installed, otherwise a list.
+    Dates are assumed valid (no per-element checks)."""
+    np = _numpy()
+    if np is not None:
+        return _days_from_civil(np.asarray(days, dtype=np.int64),
+                                np.asarray(months, dtype=np.int64),
+                                np.asarray(years, dtype=np.int64))
+    return [_days_from_civil(d, m, y) for d, m, y in zip(days, months, years)]
+
+def ordinals_to_dates(ordinals):
+    """Vectorized ordinal_to_date. Returns (days, months, years) arrays (lists without numpy)."""
+    np = _numpy()
+    if np is not None:
+        return _civil_from_days(np.asarray(ordinals, dtype=np.int64))
+    triples = [_civil_from_days(n) for n in ordinals]
+    return [t[0] for t in triples], [t[1] for t in triples], [t[2] for t in triples]
+
+# Batch triangle checks: problem_2_12, 2_9, 2_14 and 1_6 over many triangles at once.
+# Codes index into these tuples; 0 always means the row is not a triangle.
+TRIANGLE_TYPES = ('not_triangle', 'equilateral', 'isosceles', 'right', 'right_isosceles', 'scalene')
+ANGLE_TYPES = ('not_triangle', 'acute', 'right', 'obtuse')
+_TRIANGLE_EPS = 1e-9
+
+TriangleBatch = namedtuple('TriangleBatch', 'valid type angle perimeter area')
+
+def _triangle_row(a, b, c):
+    if not problem_2_12_can_be_triangle(a, b, c):
+        return False, 0, 0, nan, nan
+    x, y, z = sorted((a, b, c))
+    val = x*x + y*y - z*z
+    right = abs(val) < _TRIANGLE_EPS
+    ab, ac, bc = abs(a-b) < _TRIANGLE_EPS, abs(a-c) < _TRIANGLE_EPS, abs(b-c) < _TRIANGLE_EPS
+    isos = ab or ac or bc
+    if ab and bc:
+        kind = 1
+    elif right:
+        kind = 4 if isos else 3
+    else:
+        kind = 2 if isos else 5
+    angle = 2 if right else 1 if val > 0 else 3
+    p = a + b + c
+    s = p / 2.0
+    q = s * (s - a) * (s - b) * (s - c)
+    return True, kind, angle, p, sqrt(q) if q >= 0 else nan
+
+def classify_triangles(a, b=None, c=None) -> TriangleBatch:
+    """Vectorized problem_2_12 / 2_9 / 2_14 / 1_6: pass three side sequences, or one N x 3 array.
+    Returns TriangleBatch(valid, type, angle, perimeter, area) of numpy arrays (float64 math),
+    or of lists without numpy. type/angle are codes into TRIANGLE_TYPES / ANGLE_TYPES.
+    Rows that are not triangles (including NaN sides) get code 0 and NaN perimeter/area
+    instead of raising."""
+    np = _numpy()
+    if np is None:
+        rows = a if b is None else zip(a, b, c)
+        cols = list(zip(*(_triangle_row(*row) for row in rows))) or [(), (), (), (), ()]
+        return TriangleBatch(*(list(col) for col in cols))
+    if b is None:
+        sides = np.asarray(a, dtype=np.float64).reshape(-1, 3)
+        a, b, c = sides[:, 0], sides[:, 1], sides[:, 2]
+    else:
+        a, b, c = (np.asarray(v, dtype=np.float64) for v in (a, b, c))
+    with np.errstate(invalid='ignore'):
+        valid = (a > 0) & (b > 0) & (c > 0) & (a + b > c) & (a + c > b) & (b + c > a)
+        # sorting network instead of a sort per row
+        lo, hi = np.minimum(a, b), np.maximum(a, b)
+        x, y, z = np.minimum(lo, c), np.maximum(lo, np.minimum(hi, c)), np.maximum(hi, c)
+        val = x*x + y*y - z*z
+        right = np.abs(val) < _TRIANGLE_EPS
+        ab, ac, bc = (np.abs(a - b) < _TRIANGLE_EPS, np.abs(a - c) < _TRIANGLE_EPS,
+                      np.abs(b - c) < _TRIANGLE_EPS)
+        isos = ab | ac | bc
+        kind = np.select([~valid, ab & bc, right & isos, right, isos], [0, 1, 4, 3, 2], 5).astype(np.int8)
+        angle = np.select([~valid, right, val > 0], [0, 2, 1], 3).astype(np.int8)
+        p = a + b + c
+        s = p / 2.0
+        area = np.sqrt(np.where(valid, s * (s - a) * (s - b) * (s - c), nan))
+    return TriangleBatch(valid, kind, angle, np.where(valid, p, nan), area)
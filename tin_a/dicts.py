@@ -0,0 +1,38 @@
+"""Section 8: Dictionaries."""
+from typing import Tuple, List
+
+def problem_8_1_word_occurrences(s: str) -> dict:
+    words = s.split()
+    d = {}
+    for w in words:
+        d[w] = d.get(w,0) + 1
+    return d
+
+def problem_8_2_student_dict(students: List[Tuple[str,int,str]]) -> dict:
+    return {sid: {'name':name,'age':age,'class':cl} for sid,(name,age,cl) in enumerate(students, start=1)}
+
+def problem_8_3_sort_dict_by_value(d: dict) -> List[Tuple]:
+    return sorted(d.items(), key=lambda kv: kv[1])
+
+def problem_8_4_simple_translate(sentence: str, dictionary: dict) -> str:
+    return ' '.join(dictionary.get(w,w) for w in sentence.split())
+
+def problem_8_5_char_frequency(s: str) -> dict:
+    d={}
+    for ch in s:
+        d[ch]=d.get(ch,0)+1
+    return d
+
+def problem_8_6_merge_dicts(a: dict, b: dict) -> dict:
+    res = a.copy()
+    res.update(b)
+    return res
+
+def problem_8_7_remove_duplicate_keys(d1: dict, d2: dict) -> dict:
+    for k in list(d1.keys()):
+        if k in d2:
+            del d1[k]
+    return d1
+
+def problem_8_8_mini_database() -> dict:
+    return {}
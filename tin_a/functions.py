@@ -0,0 +1,95 @@
+"""Section 4: Functions."""
+from math import sqrt
+from typing import Tuple, List
+from .basic_io import problem_1_1_c_to_f, problem_1_1_f_to_c
+from .loops import problem_3_5_is_perfect, problem_3_6_count_primes_less_than
+
+def problem_4_1_seconds_from_hms(h:int,m:int,s:int) -> int:
+    return h*3600 + m*60 + s
+
+def problem_4_2_sum_n(n:int) -> int:
+    return n*(n+1)//2
+
+def problem_4_3_primes_in_range(a:int,b:int) -> List[int]:
+    if b < 2 or a > b:
+        return []
+    sieve = [True]*(b+1)
+    sieve[0]=sieve[1]=False
+    p=2
+    while p*p <= b:
+        if sieve[p]:
+            for multiple in range(p*p, b+1, p):
+                sieve[multiple]=False
+        p+=1
+    return [i for i in range(max(a,2), b+1) if sieve[i]]
+
+def problem_4_4_largest_prime_less_than(n:int) -> int:
+    if n <= 2:
+        return None
+    for cand in range(n-1,1,-1):
+        if problem_3_6_count_primes_less_than(cand+1) - problem_3_6_count_primes_less_than(cand) == 1 and all(cand % d for d in range(2,int(sqrt(cand))+1)):
+            return cand
+    return None
+
+def problem_4_5_hanoi_moves(n:int, src='A', aux='B', dst='C') -> List[Tuple[str,str]]:
+    moves = []
+    def move(k, a, b, c):
+        if k==1:
+            moves.append((a,c))
+        else:
+            move(k-1,a,c,b)
+            moves.append((a,c))
+            move(k-1,b,a,c)
+    move(n, src, aux, dst)
+    return moves
+
+def problem_4_6_sort_names(names: List[str]) -> List[str]:
+    return sorted(names)
+
+def problem_4_7_is_perfect_square(n:int) -> bool:
+    if n<0: return False
+    r=int(sqrt(n))
+    return r*r==n
+
+def problem_4_8_min_in_list(arr: List[int]) -> int:
+    if not arr: return None
+    m=arr[0]
+    for x in arr[1:]:
+        if x<m: m=x
+    return m
+
+def problem_4_9_fibonacci_recursive(n:int) -> int:
+    if n<=0: return 0
+    if n==1: return 0
+    if n==2: return 1
+    return problem_4_9_fibonacci_recursive(n-1) + problem_4_9_fibonacci_recursive(n-2)
+
+def problem_4_10_valid_email(email: str) -> bool:
+    if '@' not in email or email.count('@')!=1: return False
+    user, domain = email.split('@')
+    if not user or not domain: return False
+    if '.' not in domain: return False
+    return True
+
+def problem_4_11_is_perfect_number(n:int) -> bool:
+    return problem_3_5_is_perfect(n)
+
+def problem_4_12_max_digit(n:int) -> int:
+    return max(int(d) for d in str(abs(n)))
+
+def problem_4_13_c_to_f_func(c: float) -> float:
+    return problem_1_1_c_to_f(c)
+def problem_4_13_f_to_c_func(f: float) -> float:
+    return problem_1_1_f_to_c(f)
+
+def problem_4_14_recursive_sum(a:int,b:int) -> int:
+    if a>b: return 0
+    if a==b: return a
+    return a + problem_4_14_recursive_sum(a+1,b)
+
+def problem_4_15_password_strength(password: str) -> bool:
+    if len(password) < 8: return False
+    has_upper = any(ch.isupper() for ch in password)
+    has_lower = any(ch.islower() for ch in password)
+    has_digit = any(ch.isdigit() for ch in password)
+    return has_upper and has_lower and has_digit
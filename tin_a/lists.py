@@ -0,0 +1,86 @@
+"""Section 7: Lists."""
+from math import sqrt
+from typing import Tuple, List
+from .loops import problem_3_19_fibonacci
+
+def problem_7_1_sum_odds_in_list(arr: List[int]) -> int:
+    return sum(x for x in arr if x%2==1)
+
+def problem_7_2_max_in_list(arr: List[float]) -> float:
+    return max(arr) if arr else None
+
+def problem_7_3_list_comprehensions(limit:int) -> Tuple[List[int], List[int]]:
+    multiples_of_3 = [i for i in range(1,limit+1) if i%3==0]
+    squares = [i*i for i in range(1,limit+1) if int(sqrt(i))**2 == i]
+    return multiples_of_3, squares
+
+def problem_7_4_is_arithmetic_sequence(arr: List[int]) -> bool:
+    if len(arr) < 2: return True
+    d = arr[1] - arr[0]
+    return all(arr[i] - arr[i-1] == d for i in range(1,len(arr)))
+
+def problem_7_5_fibonacci_list(n:int) -> List[int]:
+    return problem_3_19_fibonacci(n)
+
+def problem_7_6_count_primes_in_list(arr: List[int]) -> int:
+    return sum(1 for x in arr if x>1 and all(x%d for d in range(2,int(sqrt(x))+1)))
+
+def problem_7_7_add_matrices(A: List[List[int]], B: List[List[int]]) -> List[List[int]]:
+    n = len(A); m = len(A[0])
+    return [[A[i][j] + B[i][j] for j in range(m)] for i in range(n)]
+
+def problem_7_8_print_people_info(people: List[dict]) -> List[str]:
+    return [f"{p.get('name')} - {p.get('age')} - {p.get('gender')} - {p.get('hometown')}" for p in people]
+
+def problem_7_9_basic_sort(arr: List[int]) -> List[int]:
+    # simple bubble sort
+    a = arr[:]
+    n = len(a)
+    for i in range(n):
+        for j in range(0,n-i-1):
+            if a[j] > a[j+1]:
+                a[j], a[j+1] = a[j+1], a[j]
+    return a
+
+def problem_7_10_linear_search(arr: List[int], key:int) -> int:
+    for i,v in enumerate(arr):
+        if v==key:
+            return i
+    return -1
+
+def problem_7_11_matrix_diagonal_sums(mat: List[List[int]]) -> Tuple[int,int]:
+    n = len(mat)
+    main = sum(mat[i][i] for i in range(n))
+    anti = sum(mat[i][n-1-i] for i in range(n))
+    return main, anti
+
+def problem_7_12_matrix_multiply(A: List[List[int]], B: List[List[int]]) -> List[List[int]]:
+    n = len(A); m = len(B[0]); p = len(B)
+    C = [[0]*m for _ in range(n)]
+    for i in range(n):
+        for j in range(m):
+            for k in range(p):
+                C[i][j] += A[i][k]*B[k][j]
+    return C
+
+def problem_7_13_second_largest(arr: List[int]) -> int:
+    uniq = sorted(set(arr), reverse=True)
+    return uniq[1] if len(uniq) > 1 else None
+
+def problem_7_14_insert_at(arr: List[int], idx:int, val:int) -> List[int]:
+    return arr[:idx] + [val] + arr[idx:]
+
+def problem_7_15_remove_value(arr: List[int], val:int) -> List[int]:
+    return [x for x in arr if x != val]
+
+def problem_7_16_reverse_list(arr: List) -> List:
+    return arr[::-1]
+
+def problem_7_17_is_symmetric_matrix(mat: List[List[int]]) -> bool:
+    n = len(mat)
+    return all(mat[i][j] == mat[j][i] for i in range(n) for j in range(n))
+
+def problem_7_18_row_col_max(mat: List[List[int]]) -> Tuple[int,int]:
+    row_sums = [sum(r) for r in mat]
+    col_sums = [sum(mat[i][j] for i in range(len(mat))) for j in range(len(mat[0]))]
+    return max(row_sums), max(col_sums)
@@ -0,0 +1,156 @@
+"""Section 3: Loops."""
+from math import sqrt
+from typing import Tuple, List
+
+def problem_3_1_sum_range(a:int,b:int) -> int:
+    return sum(range(a,b+1))
+
+def problem_3_2_sum_odd_squares(a:int,b:int) -> int:
+    return sum(i*i for i in range(a,b+1) if i%2==1)
+
+def problem_3_3_times_table(n:int) -> List[str]:
+    lines = []
+    for i in range(1,10):
+        lines.append(f"{n} x {i} = {n*i}")
+    return lines
+
+def problem_3_4_gcd_lcm(a:int,b:int) -> Tuple[int,int]:
+    from math import gcd
+    if a==0 and b==0:
+        return 0,0
+    g = gcd(a,b)
+    l = abs(a//g * b) if g!=0 else 0
+    return g,l
+
+def problem_3_5_is_perfect(n:int) -> bool:
+    if n<=1: return False
+    s = 1
+    i = 2
+    while i*i <= n:
+        if n % i == 0:
+            s += i
+            if i != n//i:
+                s += n//i
+        i += 1
+    return s == n
+
+def problem_3_6_count_primes_less_than(n:int) -> int:
+    if n <= 2:
+        return 0
+    sieve = [True]*n
+    sieve[0]=sieve[1]=False
+    p=2
+    while p*p < n:
+        if sieve[p]:
+            for multiple in range(p*p, n, p):
+                sieve[multiple]=False
+        p+=1
+    return sum(1 for i in range(n) if sieve[i])
+
+def problem_3_7_sum_series_x(n:int) -> float:
+    """Example: sum_{i=1..n} 1/i until n"""
+    if n<=0: return 0.0
+    return sum(1.0/i for i in range(1,n+1))
+
+def problem_3_8_hundred_cows():
+    """Return list of solutions to classic problem (x+y+z=100 with cost constraints).
+    Return list of tuples (bulls,cows,calves) that satisfy problem variant if implemented.
+    Here we return classic: 100 animals costing 100 units with 5 per bull, 3 per cow, 0.5 per calf -> example.
+    This problem has many formulations; we implement the classical Chinese variant.
+    """
+    solutions = []
+    # classic: bull=5, cow=3, calf=1/3 ; modify as needed
+    for bulls in range(0,21):
+        for cows in range(0,34):
+            calves = 100 - bulls - cows
+            if calves < 0: continue
+            cost = 5*bulls + 3*cows + calves/3
+            if abs(cost - 100) < 1e-9:
+                solutions.append((bulls,cows,calves))
+    return solutions
+
+def problem_3_9_prime_factorization(n:int) -> List[int]:
+    factors = []
+    if n <= 1:
+        return factors
+    d = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors.append(d)
+            n //= d
+        d += 1 if d==2 else 2
+    if n>1:
+        factors.append(n)
+    return factors
+
+def problem_3_10_is_palindrome_number(n:int) -> bool:
+    s = str(n)
+    return s == s[::-1]
+
+def problem_3_11_sum_digits(n:int) -> int:
+    s = 0
+    for ch in str(abs(n)):
+        s += int(ch)
+    return s
+
+def problem_3_12_list_divisors(n:int) -> List[int]:
+    res = []
+    for i in range(1,int(sqrt(n))+1):
+        if n % i ==0:
+            res.append(i)
+            if i != n//i:
+                res.append(n//i)
+    return sorted(res)
+
+def problem_3_13_power(base:float, exp:int) -> float:
+    if exp == 0:
+        return 1.0
+    sign = 1
+    if exp < 0:
+        base = 1/base
+        exp = -exp
+    result = 1.0
+    for _ in range(exp):
+        result *= base
+    return result
+
+def problem_3_14_draw_shapes(kind:str, n:int) -> List[str]:
+    """Return list of strings representing ascii shape. kind='square' or 'triangle'"""
+    out = []
+    if kind == 'square':
+        for _ in range(n):
+            out.append('*'*n)
+    elif kind == 'triangle':
+        for i in range(1,n+1):
+            out.append('*'*i)
+    return out
+
+def problem_3_15_reverse_number(n:int) -> int:
+    s = str(abs(n))[::-1]
+    val = int(s)
+    return -val if n<0 else val
+
+def problem_3_16_count_digits(n:int) -> int:
+    return len(str(abs(n)))
+
+def problem_3_17_is_armstrong(n:int) -> bool:
+    s = str(n)
+    k = len(s)
+    return sum(int(ch)**k for ch in s) == n
+
+def problem_3_18_floyd_triangle(lines:int) -> List[str]:
+    out=[]
+    cur=1
+    for r in range(1,lines+1):
+        row = ' '.join(str(i) for i in range(cur,cur+r))
+        out.append(row)
+        cur += r
+    return out
+
+def problem_3_19_fibonacci(n:int) -> List[int]:
+    if n<=0: return []
+    if n==1: return [0]
+    res=[0,1]
+    while len(res) < n:
+        res.append(res[-1]+res[-2])
+    return res[:n]
@@ -0,0 +1,82 @@
+"""Section 10: OOP."""
+from math import pi, sqrt
+from typing import List
+
+class Polygon:
+    def __init__(self, sides: List[float]):
+        self.sides = sides
+
+class Triangle(Polygon):
+    def __init__(self, a,b,c):
+        super().__init__([a,b,c])
+    def perimeter(self):
+        return sum(self.sides)
+    def area(self):
+        s = self.perimeter()/2
+        a,b,c = self.sides
+        return sqrt(s*(s-a)*(s-b)*(s-c))
+
+class Student:
+    def __init__(self, name:str, scores: List[float]):
+        self.name = name
+        self.scores = scores
+    def average(self):
+        return sum(self.scores)/len(self.scores) if self.scores else 0.0
+
+class Fraction:
+    def __init__(self, p:int,q:int):
+        if q==0: raise ValueError('denominator 0')
+        from math import gcd
+        g = gcd(p,q)
+        self.p = p//g
+        self.q = q//g
+    def __str__(self):
+        return f"{self.p}/{self.q}"
+
+class Circle:
+    def __init__(self, r: float):
+        self.r = r
+    def area(self):
+        return pi*self.r*self.r
+    def volume_of_cylinder(self,height:float):
+        return self.area()*height
+
+class Car:
+    def __init__(self, speed=0.0):
+        self.speed = speed
+    def accelerate(self, dv):
+        self.speed += dv
+    def decelerate(self, dv):
+        self.speed = max(0.0, self.speed - dv)
+
+class ComplexNumber:
+    def __init__(self, a:float, b:float):
+        self.a = a
+        self.b = b
+    def __add__(self, other):
+        return ComplexNumber(self.a+other.a, self.b+other.b)
+    def __str__(self):
+        return f"{self.a}+{self.b}j"
+
+class Employee:
+    def __init__(self, name:str, salary:float):
+        self.name = name
+        self.salary = salary
+    def net_salary(self, tax_rate:float):
+        return self.salary * (1 - tax_rate)
+
+class Animal:
+    def speak(self):
+        return ''
+class Dog(Animal):
+    def speak(self):
+        return 'Woof'
+class Cat(Animal):
+    def speak(self):
+        return 'Meow'
+
+class Point2D:
+    def __init__(self,x,y):
+        self.x=x;self.y=y
+    def __str__(self):
+        return f"({self.x:.2f}, {self.y:.2f})"
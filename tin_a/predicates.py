@@ -0,0 +1,370 @@
+"""
+Composable integer predicates (generalizes bai1 of SOT381-PYTHON.py).
+
+Build predicates from divisibility and comparison atoms and combine them with
+& (and), | (or) and ~ (not):
+
+    p = divisible_by(2) & gt(10) & divisible_by(3)      # bai1
+    p(12)                   -> True
+    p.filter([6, 12, 18])   -> [12, 18]   (numpy array in, numpy array out)
+    p.count(1, 10**18)      -> 166666666666666665, without scanning
+    list(p.matches(1, 40))  -> [12, 18, 24, 30, 36]
+
+count() and matches() work in closed form when the predicate only uses
+divisible_by and comparisons. The comparison thresholds cut [a, b] into
+segments where every comparison is constant. Inside a segment, the numbers
+matching each truth assignment of the divisibility atoms are counted with
+lcm and inclusion-exclusion. Predicates built with where(fn) fall back to
+testing every integer.
+"""
+import operator
+from functools import reduce
+from itertools import combinations, product
+from math import ceil, floor, gcd, isfinite
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from ._optional import numpy as _numpy
+
+# above this many distinct moduli inclusion-exclusion (3^m terms) is not worth it;
+# count() then uses the residues of one lcm period instead
+MAX_MODULI = 12
+# largest lcm for which matches() precomputes the residues of one period
+MAX_PERIOD = 1 << 20
+
+
+def _lcm(a: int, b: int) -> int:
+    return a // gcd(a, b) * b
+
+
+def _count_multiples(k: int, a: int, b: int) -> int:
+    """Multiples of k in [a, b]."""
+    return b // k - (a - 1) // k
+
+
+class Predicate:
+    """Base class; subclasses implement __call__, _mask and _partial."""
+
+    def __call__(self, x) -> bool:
+        raise NotImplementedError
+
+    def __and__(self, other: 'Predicate') -> 'Predicate':
+        return And(self, other)
+
+    def __or__(self, other: 'Predicate') -> 'Predicate':
+        return Or(self, other)
+
+    def __invert__(self) -> 'Predicate':
+        return Not(self)
+
+    # -- vectorized evaluation --
+    def mask(self, values):
+        """Truth value for every element: bool numpy array if numpy is installed, else a list."""
+        np = _numpy()
+        if np is None:
+            return [bool(self(x)) for x in values]
+        return self._mask(np.asarray(values), np)
+
+    def filter(self, values):
+        """Elements of values that satisfy the predicate."""
+        np = _numpy()
+        if np is None:
+            return [x for x in values if self(x)]
+        arr = np.asarray(values)
+        return arr[self._mask(arr, np)]
+
+    def _mask(self, arr, np):
+        return np.fromiter((bool(self(x)) for x in arr.ravel()), dtype=bool,
+                           count=arr.size).reshape(arr.shape)
+
+    # -- closed form over integer ranges --
+    def atoms(self) -> List['Predicate']:
+        return [self]
+
+    def _partial(self, known: Dict['Predicate', bool]):
+        """Evaluate with some atoms fixed: returns True, False or a residual predicate."""
+        return known.get(self, self)
+
+    def is_closed_form(self) -> bool:
+        return all(isinstance(a, (DivisibleBy, Compare)) for a in self.atoms())
+
+    def count(self, a: int, b: int) -> int:
+        """Number of integers x in [a, b] with self(x)."""
+        if a > b:
+            return 0
+        if not self.is_closed_form():
+            return sum(1 for x in range(a, b + 1) if self(x))
+        total = 0
+        for lo, hi, residual in _segments(self, a, b):
+            total += _count_segment(residual, lo, hi)
+        return total
+
+    def matches(self, a: int, b: int) -> Iterator[int]:
+        """Integers x in [a, b] with self(x), in increasing order."""
+        if a > b:
+            return
+        if not self.is_closed_form():
+            yield from (x for x in range(a, b + 1) if self(x))
+            return
+        for lo, hi, residual in _segments(self, a, b):
+            yield from _matches_segment(residual, lo, hi)
+
+
+class DivisibleBy(Predicate):
+    def __init__(self, k: int):
+        if k == 0:
+            raise ValueError('k must be non-zero')
+        self.k = abs(k)
+
+    def __call__(self, x) -> bool:
+        return x % self.k == 0
+
+    def _mask(self, arr, np):
+        return arr % self.k == 0
+
+    def __eq__(self, other):
+        return isinstance(other, DivisibleBy) and other.k == self.k
+
+    def __hash__(self):
+        return hash(('div', self.k))
+
+    def __repr__(self):
+        return f"divisible_by({self.k})"
+
+
+_OPS = {'<': operator.lt, '<=': operator.le, '>': operator.gt,
+        '>=': operator.ge, '==': operator.eq, '!=': operator.ne}
+
+
+class Compare(Predicate):
+    def __init__(self, op: str, value):
+        if op not in _OPS:
+            raise ValueError(f"unknown comparison {op!r}")
+        self.op = op
+        self.value = value
+        self._fn = _OPS[op]
+
+    def __call__(self, x) -> bool:
+        return self._fn(x, self.value)
+
+    def _mask(self, arr, np):
+        return self._fn(arr, self.value)
+
+    def cuts(self) -> List[int]:
+        """Integers c where the truth value may differ between c - 1 and c."""
+        v = self.value
+        if not isfinite(v):
+            return []  # the comparison has the same value for every integer
+        if self.op in ('>', '<='):
+            return [floor(v) + 1]
+        if self.op in ('>=', '<'):
+            return [ceil(v)]
+        return [int(v), int(v) + 1] if v == int(v) else []  # == / != only change at an integer
+
+    def __eq__(self, other):
+        return isinstance(other, Compare) and (other.op, other.value) == (self.op, self.value)
+
+    def __hash__(self):
+        return hash(('cmp', self.op, self.value))
+
+    def __repr__(self):
+        return f"x {self.op} {self.value!r}"
+
+
+class Where(Predicate):
+    """Arbitrary callable; count() / matches() fall back to scanning."""
+
+    def __init__(self, fn: Callable[[int], bool], vectorized: Callable = None):
+        self.fn = fn
+        self.vectorized = vectorized
+
+    def __call__(self, x) -> bool:
+        return bool(self.fn(x))
+
+    def _mask(self, arr, np):
+        if self.vectorized is not None:
+            return np.asarray(self.vectorized(arr), dtype=bool)
+        return Predicate._mask(self, arr, np)
+
+    def __repr__(self):
+        return f"where({getattr(self.fn, '__name__', self.fn)})"
+
+
+class And(Predicate):
+    def __init__(self, *parts: Predicate):
+        self.parts = parts
+
+    def __call__(self, x) -> bool:
+        return all(p(x) for p in self.parts)
+
+    def _mask(self, arr, np):
+        return reduce(np.logical_and, (p._mask(arr, np) for p in self.parts))
+
+    def atoms(self):
+        return [a for p in self.parts for a in p.atoms()]
+
+    def _partial(self, known):
+        rest = []
+        for p in self.parts:
+            v = p._partial(known)
+            if v is False:
+                return False
+            if v is not True:
+                rest.append(v)
+        return True if not rest else rest[0] if len(rest) == 1 else And(*rest)
+
+    def __repr__(self):
+        return '(' + ' & '.join(map(repr, self.parts)) + ')'
+
+
+class Or(Predicate):
+    def __init__(self, *parts: Predicate):
+        self.parts = parts
+
+    def __call__(self, x) -> bool:
+        return any(p(x) for p in self.parts)
+
+    def _mask(self, arr, np):
+        return reduce(np.logical_or, (p._mask(arr, np) for p in self.parts))
+
+    def atoms(self):
+        return [a for p in self.parts for a in p.atoms()]
+
+    def _partial(self, known):
+        rest = []
+        for p in self.parts:
+            v = p._partial(known)
+            if v is True:
+                return True
+            if v is not False:
+                rest.append(v)
+        return False if not rest else rest[0] if len(rest) == 1 else Or(*rest)
+
+    def __repr__(self):
+        return '(' + ' | '.join(map(repr, self.parts)) + ')'
+
+
+class Not(Predicate):
+    def __init__(self, part: Predicate):
+        self.part = part
+
+    def __call__(self, x) -> bool:
+        return not self.part(x)
+
+    def _mask(self, arr, np):
+        return np.logical_not(self.part._mask(arr, np))
+
+    def atoms(self):
+        return self.part.atoms()
+
+    def _partial(self, known):
+        v = self.part._partial(known)
+        return (not v) if isinstance(v, bool) else Not(v)
+
+    def __repr__(self):
+        return f"~{self.part!r}"
+
+
+# ---------------------
+# Constructors
+# ---------------------
+def divisible_by(k: int) -> Predicate:
+    return DivisibleBy(k)
+
+def lt(v) -> Predicate:
+    return Compare('<', v)
+
+def le(v) -> Predicate:
+    return Compare('<=', v)
+
+def gt(v) -> Predicate:
+    return Compare('>', v)
+
+def ge(v) -> Predicate:
+    return Compare('>=', v)
+
+def eq(v) -> Predicate:
+    return Compare('==', v)
+
+def ne(v) -> Predicate:
+    return Compare('!=', v)
+
+def between(lo, hi) -> Predicate:
+    """lo <= x <= hi"""
+    return Compare('>=', lo) & Compare('<=', hi)
+
+def where(fn: Callable[[int], bool], vectorized: Callable = None) -> Predicate:
+    """Wrap a plain callable; pass vectorized(arr) -> bool array to speed up mask()."""
+    return Where(fn, vectorized)
+
+
+# ---------------------
+# Closed-form helpers
+# ---------------------
+def _moduli(pred: Predicate) -> List[DivisibleBy]:
+    return list(dict.fromkeys(a for a in pred.atoms() if isinstance(a, DivisibleBy)))
+
+
+def _segments(pred: Predicate, a: int, b: int) -> Iterator[Tuple[int, int, object]]:
+    """Split [a, b] where comparisons change; yield (lo, hi, residual over divisibility atoms)."""
+    compares = list(dict.fromkeys(x for x in pred.atoms() if isinstance(x, Compare)))
+    cuts = sorted({c for cmp in compares for c in cmp.cuts() if a < c <= b})
+    bounds = [a] + cuts + [b + 1]
+    for lo, nxt in zip(bounds, bounds[1:]):
+        known = {cmp: cmp(lo) for cmp in compares}
+        residual = pred._partial(known)
+        if residual is not False:
+            yield lo, nxt - 1, residual
+
+
+def _count_pattern(true_ks: List[int], false_ks: List[int], lo: int, hi: int) -> int:
+    """Integers in [lo, hi] divisible by every k in true_ks and by none in false_ks."""
+    base = reduce(_lcm, true_ks, 1)
+    total = 0
+    for r in range(len(false_ks) + 1):
+        for subset in combinations(false_ks, r):
+            total += (-1) ** r * _count_multiples(reduce(_lcm, subset, base), lo, hi)
+    return total
+
+
+def _count_segment(residual, lo: int, hi: int) -> int:
+    if residual is True:
+        return hi - lo + 1
+    atoms = _moduli(residual)
+    if len(atoms) > MAX_MODULI:
+        period = reduce(_lcm, (d.k for d in atoms), 1)
+        if period > MAX_PERIOD:
+            return sum(1 for x in range(lo, hi + 1) if residual(x))
+        residues = [r for r in range(period) if residual(r)]
+        full, rest = divmod(hi - lo + 1, period)
+        return full * len(residues) + sum(1 for x in range(hi - rest + 1, hi + 1) if residual(x))
+    total = 0
+    for values in product((True, False), repeat=len(atoms)):
+        known = dict(zip(atoms, values))
+        if residual._partial(known) is True:
+            true_ks = [d.k for d, v in known.items() if v]
+            false_ks = [d.k for d, v in known.items() if not v]
+            total += _count_pattern(true_ks, false_ks, lo, hi)
+    return total
+
+
+def _matches_segment(residual, lo: int, hi: int) -> Iterator[int]:
+    if residual is True:
+        yield from range(lo, hi + 1)
+        return
+    atoms = _moduli(residual)
+    period = reduce(_lcm, (d.k for d in atoms), 1)
+    if period > MAX_PERIOD:
+        yield from (x for x in range(lo, hi + 1) if residual(x))
+        return
+    # residues r in [0, period) that match, then step through the segment period by period
+    residues = [r for r in range(period) if residual(r)]
+    if not residues:
+        return
+    start = lo - lo % period
+    for base in range(start, hi + 1, period):
+        for r in residues:
+            x = base + r
+            if x > hi:
+                return
+            if x >= lo:
+                yield x
@@ -0,0 +1,292 @@
+"""
+Range scans for number properties: every x in [a, b] with some property, in order.
+
+    from tin_a import rangescan
+    list(rangescan.scan('armstrong', 1, 10**9))     # or problem_3_17_is_armstrong / '3_17'
+    rangescan.count('palindrome', 1, 10**18)        # 1999999998, nothing enumerated
+    for x in rangescan.scan(my_predicate, 1, 10**8, workers=4): ...
+
+Properties with a direct construction are not tested one integer at a time:
+  palindrome  (problem_3_10)  built from their first half; count() is closed form
+  armstrong   (problem_3_17)  one candidate per multiset of digits, checked by
+                              sorting the digits of its power sum (numbers of
+                              length k cost C(k+9, 9) candidates instead of 9*10^(k-1))
+  perfect     (problem_3_5, 4_11)  Euclid-Euler 2^(p-1)(2^p-1), with 2^p-1
+                              checked by Lucas-Lehmer
+Closed-form tin_a.predicates objects use Predicate.matches / count.
+
+Any other callable is evaluated for every integer. [a, b] is split into chunks
+and the chunks run in a process pool, so the callable must be picklable (a
+module-level function). At most `workers * 2` chunks are in flight. Results
+are streamed back in chunk order, so matches arrive sorted. The Armstrong
+search sends one digit length per task to the same pool.
+
+Usage:
+    python -m tin_a.rangescan armstrong 1 1000000000
+    python -m tin_a.rangescan 3_5 1 1000000 --count -w 4
+"""
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations_with_replacement
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from .predicates import Predicate
+
+# no Armstrong number has more digits: k * 9**k < 10**(k - 1) for k >= 61
+MAX_ARMSTRONG_DIGITS = 60
+# odd perfect numbers are known not to exist below this bound
+ODD_PERFECT_BOUND = 10 ** 1500
+
+
+# ---------------------
+# Palindromes
+# ---------------------
+def _mirror(half: int, length: int) -> int:
+    s = str(half)
+    return int(s + s[-1 - length % 2::-1])
+
+
+def palindromes(a: int, b: int) -> Iterator[int]:
+    """Palindromic numbers in [a, b] in increasing order (negatives never are)."""
+    a = max(a, 0)
+    if a > b:
+        return
+    first_length = len(str(a))
+    for length in range(first_length, len(str(b)) + 1):
+        half = (length + 1) // 2
+        start = 0 if length == 1 else 10 ** (half - 1)
+        if length == first_length:
+            start = max(start, int(str(a)[:half]))
+        for h in range(start, 10 ** half):
+            p = _mirror(h, length)
+            if p > b:
+                return
+            if p >= a:
+                yield p
+
+
+def _palindromes_upto(n: int) -> int:
+    """Number of palindromes in [0, n]."""
+    if n < 0:
+        return 0
+    s = str(n)
+    total = 0
+    for length in range(1, len(s)):
+        total += 10 if length == 1 else 9 * 10 ** ((length + 1) // 2 - 1)
+    half = (len(s) + 1) // 2
+    prefix = int(s[:half])
+    total += prefix - (0 if len(s) == 1 else 10 ** (half - 1))
+    if _mirror(prefix, len(s)) <= n:
+        total += 1
+    return total
+
+
+def count_palindromes(a: int, b: int) -> int:
+    return max(0, _palindromes_upto(b) - _palindromes_upto(a - 1))
+
+
+# ---------------------
+# Armstrong numbers
+# ---------------------
+def armstrong_of_length(k: int) -> List[int]:
+    """All k-digit Armstrong numbers, sorted."""
+    powers = {d: int(d) ** k for d in '0123456789'}
+    lo, hi = (0 if k == 1 else 10 ** (k - 1)), 10 ** k
+    found = []
+    for digits in combinations_with_replacement('0123456789', k):
+        s = sum(map(powers.__getitem__, digits))
+        if lo <= s < hi and tuple(sorted(str(s))) == digits:
+            found.append(s)
+    return sorted(found)
+
+
+def _armstrong_tasks(a: int, b: int) -> List[Tuple[Callable, tuple]]:
+    a = max(a, 0)
+    if a > b:
+        return []
+    lengths = range(len(str(a)), min(len(str(b)), MAX_ARMSTRONG_DIGITS) + 1)
+    return [(_armstrong_chunk, (k, a, b)) for k in lengths]
+
+
+def _armstrong_chunk(k: int, a: int, b: int) -> List[int]:
+    return [n for n in armstrong_of_length(k) if a <= n <= b]
+
+
+def armstrong_numbers(a: int, b: int, workers: int = 0) -> Iterator[int]:
+    """Armstrong numbers in [a, b] in increasing order (negatives never are)."""
+    return _stream(_armstrong_tasks(a, b), workers)
+
+
+# ---------------------
+# Perfect numbers
+# ---------------------
+def _is_small_prime(p: int) -> bool:
+    if p < 2:
+        return False
+    i = 2
+    while i * i <= p:
+        if p % i == 0:
+            return False
+        i += 1
+    return True
+
+
+def is_mersenne_prime(p: int) -> bool:
+    """Is 2**p - 1 prime? (Lucas-Lehmer, p itself must be prime.)"""
+    if p == 2:
+        return True
+    m = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = (s * s - 2) % m
+    return s == 0
+
+
+def perfect_numbers(a: int, b: int) -> Iterator[int]:
+    """Perfect numbers in [a, b] in increasing order."""
+    if b >= ODD_PERFECT_BOUND:
+        raise ValueError('odd perfect numbers are only ruled out below 10**1500')
+    p = 2
+    while True:
+        n = (1 << (p - 1)) * ((1 << p) - 1)
+        if n > b:
+            return
+        if n >= a and _is_small_prime(p) and is_mersenne_prime(p):
+            yield n
+        p += 1
+
+
+def count_perfect(a: int, b: int) -> int:
+    return sum(1 for _ in perfect_numbers(a, b))
+
+
+# ---------------------
+# Generic chunked scan
+# ---------------------
+def _scan_chunk(pred: Callable[[int], bool], lo: int, hi: int) -> List[int]:
+    return [x for x in range(lo, hi + 1) if pred(x)]
+
+
+def _count_chunk(pred: Callable[[int], bool], lo: int, hi: int) -> int:
+    return sum(1 for x in range(lo, hi + 1) if pred(x))
+
+
+def _ranges(a: int, b: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for lo in range(a, b + 1, chunk_size):
+        yield lo, min(b, lo + chunk_size - 1)
+
+
+def _run(tasks: Iterable[Tuple[Callable, tuple]], workers: int) -> Iterator:
+    """Results of fn(*args) for every task, in task order.
+    workers=0 runs in this process; otherwise at most workers * 2 tasks are in flight."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 0:
+        for fn, args in tasks:
+            yield fn(*args)
+        return
+    pool = ProcessPoolExecutor(workers)
+    try:
+        pending = deque()
+        for fn, args in tasks:
+            pending.append(pool.submit(fn, *args))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _stream(tasks: Iterable[Tuple[Callable, tuple]], workers: int) -> Iterator[int]:
+    for chunk in _run(tasks, workers):
+        yield from chunk
+
+
+def _workers(workers: int, a: int, b: int, chunk_size: int) -> int:
+    # a pool is not worth starting for a single chunk
+    return 0 if b - a + 1 <= chunk_size else workers
+
+
+# ---------------------
+# Entry points
+# ---------------------
+# scalar function name -> property with a direct construction
+PROPERTIES = {
+    'problem_3_10_is_palindrome_number': 'palindrome',
+    'problem_3_17_is_armstrong': 'armstrong',
+    'problem_3_5_is_perfect': 'perfect',
+    'problem_4_11_is_perfect_number': 'perfect',
+}
+
+
+def _property(pred):
+    """Return a property name from PROPERTIES.values(), a Predicate, or a plain callable."""
+    if isinstance(pred, str):
+        if pred in PROPERTIES.values():
+            return pred
+        from .batch import resolve
+        pred = resolve(pred)
+    if isinstance(pred, Predicate):
+        return pred
+    return PROPERTIES.get(getattr(pred, '__name__', None), pred)
+
+
+def scan(pred, a: int, b: int, workers: int = None, chunk_size: int = 1 << 16) -> Iterator[int]:
+    """Every x in [a, b] with pred(x), in increasing order.
+    pred: 'palindrome' / 'armstrong' / 'perfect', a problem function or ID, a
+    tin_a.predicates.Predicate, or any picklable callable. workers=0 disables the pool."""
+    prop = _property(pred)
+    if prop == 'palindrome':
+        return palindromes(a, b)
+    if prop == 'armstrong':
+        # lengths up to 11 take well under a second, less than starting a pool
+        return armstrong_numbers(a, b, workers if b >= 10 ** 11 else 0)
+    if prop == 'perfect':
+        return perfect_numbers(a, b)
+    if isinstance(prop, Predicate) and prop.is_closed_form():
+        return prop.matches(a, b)
+    tasks = ((_scan_chunk, (prop, lo, hi)) for lo, hi in _ranges(a, b, chunk_size))
+    return _stream(tasks, _workers(workers, a, b, chunk_size))
+
+
+def count(pred, a: int, b: int, workers: int = None, chunk_size: int = 1 << 16) -> int:
+    """Number of x in [a, b] with pred(x); see scan() for pred."""
+    prop = _property(pred)
+    if prop == 'palindrome':
+        return count_palindromes(a, b)
+    if prop == 'perfect':
+        return count_perfect(a, b)
+    if prop == 'armstrong':
+        return sum(1 for _ in scan(prop, a, b, workers))
+    if isinstance(prop, Predicate) and prop.is_closed_form():
+        return prop.count(a, b)
+    tasks = ((_count_chunk, (prop, lo, hi)) for lo, hi in _ranges(a, b, chunk_size))
+    return sum(_run(tasks, _workers(workers, a, b, chunk_size)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='List or count the integers in [a, b] with a property.')
+    parser.add_argument('property', help="palindrome, armstrong, perfect, or a problem ID / function name")
+    parser.add_argument('a', type=int)
+    parser.add_argument('b', type=int)
+    parser.add_argument('--count', action='store_true', help='print only the number of matches')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='worker processes (default: CPU count, 0 = no pool)')
+    parser.add_argument('--chunk-size', type=int, default=1 << 16)
+    args = parser.parse_args(argv)
+
+    if args.count:
+        print(count(args.property, args.a, args.b, args.workers, args.chunk_size))
+        return 0
+    out = sys.stdout
+    for x in scan(args.property, args.a, args.b, args.workers, args.chunk_size):
+        out.write(f"{x}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,441 @@
+"""
+Local asyncio request server for the problem functions.
+
+The wire protocol is JSON Lines in both directions, over localhost TCP or a
+Unix domain socket. A request names a function, which may also be a problem
+ID; its response carries the same id:
+    -> {"id": 1, "fn": "problem_3_9_prime_factorization", "args": [360]}
+    <- {"id": 1, "ok": true, "result": [2, 2, 2, 3, 3, 5]}
+Requests on one connection may be pipelined. Responses can come back out of
+order.
+
+Concurrent requests for the same function are merged into a micro-batch. A
+batch is flushed after `batch_window` seconds or once it holds `max_batch`
+calls. Only the constant-time functions in LIGHT run directly on the event
+loop; everything else runs in a process pool, so one slow call cannot stall
+the other connections. A batch is split into one slice per worker. A request
+counts as pending until its response has been flushed to the socket. When
+`max_pending` requests are pending, the server stops reading from its sockets
+until some finish. That backpressure reaches clients through the TCP window,
+including clients that pipeline requests and never read the responses.
+
+Only problem functions (full name or ID) and the helpers/classes listed in
+tin_a._EXTRA can be called. Lines longer than MAX_LINE bytes get an error
+response, as do results that are not valid JSON (inf, nan).
+
+Usage:
+    python -m tin_a.server serve --port 8765            # or --unix /tmp/tin_a.sock
+    python -m tin_a.server load --port 8765 --fn 3_9 --args "[360]" -n 20000 -c 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from .batch import _jsonable, resolve
+
+# Constant-time functions (no loops over their input), cheaper to run on the event
+# loop than to ship to another process. Everything else goes to the pool.
+LIGHT = {
+    'problem_1_1_c_to_f',
+    'problem_1_1_f_to_c',
+    'problem_1_2_div_mod',
+    'problem_1_3_area_circle',
+    'problem_1_4_freefall_velocity',
+    'problem_1_5_trapezoid_area',
+    'problem_1_6_triangle_perimeter_area',
+    'problem_1_7_rectangle_perimeter_area',
+    'problem_1_8_seconds_to_hms',
+    'problem_1_10_mean_three',
+    'problem_1_11_arithmetic_series_sum',
+    'problem_1_13_distance_points',
+    'problem_1_14_electric_bill',
+    'problem_1_15_triangle_area_by_coords',
+    'problem_2_1_even_odd',
+    'problem_2_2_expression',
+    'problem_2_3_is_leap_year',
+    'problem_2_4_grade_classification',
+    'problem_2_5_solve_linear',
+    'problem_2_6_solve_quadratic',
+    'problem_2_7_point_in_circle',
+    'problem_2_8_solve_quadratic_allcases',
+    'problem_2_9_triangle_type',
+    'problem_2_10_char_type',
+    'problem_2_11_days_in_feb',
+    'problem_2_12_can_be_triangle',
+    'problem_2_13_max_of_three',
+    'problem_2_14_triangle_angle_type',
+    'problem_2_15_year_days',
+    'problem_2_16_quadrant',
+    'problem_2_17_is_pythagorean_triplet',
+    'problem_2_18_next_prev_date',
+    'days_in_month',
+    'date_to_ordinal',
+    'ordinal_to_date',
+    'add_days',
+    'days_between',
+    'weekday',
+    'problem_3_4_gcd_lcm',
+    'problem_4_1_seconds_from_hms',
+    'problem_4_2_sum_n',
+    'problem_4_7_is_perfect_square',
+    'problem_4_13_c_to_f_func',
+    'problem_4_13_f_to_c_func',
+}
+
+DEFAULT_PORT = 8765
+# longest request/response line, in bytes, on both ends of the connection
+MAX_LINE = 2 ** 24
+
+
+def run_calls(name: str, calls: List[Tuple[list, dict]]) -> List[Tuple[bool, object]]:
+    """Execute a batch of calls to one function; errors are returned, not raised."""
+    fn = resolve(name)
+    outcomes = []
+    for args, kwargs in calls:
+        try:
+            outcomes.append((True, fn(*args, **kwargs)))
+        except Exception as e:
+            outcomes.append((False, f"{type(e).__name__}: {e}"))
+    return outcomes
+
+
+class _Batcher:
+    """Collects calls to one function and runs them together."""
+
+    def __init__(self, server: 'Server', name: str):
+        self.server = server
+        self.name = name
+        self.heavy = name not in server.light
+        self.items = []
+        self.timer = None
+
+    def submit(self, args: list, kwargs: dict) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.items.append((args, kwargs, future))
+        if len(self.items) >= self.server.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.server.batch_window, self.flush)
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        items, self.items = self.items, []
+        if items:
+            self.server._spawn(self._run(items))
+
+    async def _run(self, items):
+        calls = [(args, kwargs) for args, kwargs, _ in items]
+        self.server.batches += 1
+        try:
+            if self.heavy:
+                outcomes = await self._run_in_pool(calls)
+            else:
+                outcomes = run_calls(self.name, calls)
+        except Exception as e:  # broken pool, unpicklable arguments, ...
+            outcomes = [(False, f"{type(e).__name__}: {e}")] * len(items)
+        for (_, _, future), outcome in zip(items, outcomes):
+            if not future.done():
+                future.set_result(outcome)
+
+    async def _run_in_pool(self, calls):
+        """run_calls() on one slice of calls per worker, so a batch uses the whole pool."""
+        loop = asyncio.get_running_loop()
+        pool = self.server.pool()
+        size = -(-len(calls) // self.server.workers)
+        slices = [calls[i:i + size] for i in range(0, len(calls), size)]
+        parts = await asyncio.gather(*(loop.run_in_executor(pool, run_calls, self.name, part)
+                                       for part in slices), return_exceptions=True)
+        outcomes = []
+        for part, result in zip(slices, parts):
+            if isinstance(result, BaseException):  # broken pool, unpicklable result, ...
+                result = [(False, f"{type(result).__name__}: {result}")] * len(part)
+            outcomes.extend(result)
+        return outcomes
+
+
+class Server:
+    def __init__(self, batch_window: float = 0.002, max_batch: int = 256,
+                 max_pending: int = 10000, workers: int = None, light=LIGHT,
+                 max_line: int = MAX_LINE):
+        self.batch_window = batch_window
+        self.max_line = max_line
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.workers = workers or os.cpu_count() or 1
+        self.light = set(light)
+        self.requests = 0
+        self.batches = 0
+        self._batchers: Dict[str, _Batcher] = {}
+        self._pool = None
+        self._slots = None
+        self._tasks = set()
+        self._server = None
+
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        return self._pool
+
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def start(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT, path: str = None):
+        self._slots = asyncio.Semaphore(self.max_pending)
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle, path=path, limit=self.max_line)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=self.max_line)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                line = await _read_line(reader)
+                if not line:
+                    break
+                await self._slots.acquire()  # backpressure: stop reading while saturated
+                task = asyncio.ensure_future(self._serve_one(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_one(self, line, writer: asyncio.StreamWriter, write_lock: asyncio.Lock):
+        # the slot is held until the response is flushed, so unread responses count too
+        try:
+            text = await self._respond(line)
+            writer.write(text.encode('utf-8') + b'\n')
+            async with write_lock:
+                await writer.drain()
+        finally:
+            self._slots.release()
+
+    async def _respond(self, line) -> str:
+        record_id = None
+        try:
+            self.requests += 1
+            if line is _OVERSIZED:
+                raise ValueError(f"request line longer than {self.max_line} bytes")
+            record = json.loads(line)
+            record_id = record.get('id')
+            name = resolve(record['fn']).__name__
+            batcher = self._batchers.get(name)
+            if batcher is None:
+                batcher = self._batchers[name] = _Batcher(self, name)
+            ok, value = await batcher.submit(record.get('args', []), record.get('kwargs', {}))
+        except Exception as e:
+            ok, value = False, f"{type(e).__name__}: {e}"
+        if ok:
+            try:
+                # allow_nan=False: bare Infinity/NaN is not JSON
+                return json.dumps({'id': record_id, 'ok': True, 'result': value},
+                                  default=_jsonable, allow_nan=False)
+            except ValueError as e:
+                value = f"ValueError: {e}"
+        return json.dumps({'id': record_id, 'ok': False, 'error': value})
+
+
+_OVERSIZED = object()  # stands in for a request line over the reader's limit
+
+
+async def _read_line(reader: asyncio.StreamReader):
+    """Next line (b'' at EOF), or _OVERSIZED after skipping a line longer than the limit."""
+    try:
+        return await reader.readuntil(b'\n')
+    except asyncio.IncompleteReadError as e:
+        return e.partial  # last line without a newline
+    except asyncio.LimitOverrunError as e:
+        overrun = e
+    # drop the whole oversized line, including the part that has not arrived yet
+    while True:
+        await reader.readexactly(overrun.consumed)
+        try:
+            await reader.readuntil(b'\n')
+            return _OVERSIZED
+        except asyncio.IncompleteReadError:
+            return _OVERSIZED
+        except asyncio.LimitOverrunError as e:
+            overrun = e
+
+
+# ---------------------
+# Client and load generator
+# ---------------------
+class RemoteError(Exception):
+    """A call failed on the server; the message is the remote 'Type: message'."""
+
+
+class Client:
+    """Pipelining client: many call()s may be awaited concurrently on one connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._reader_task = asyncio.ensure_future(self._read_loop())
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = DEFAULT_PORT, path: str = None):
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def call(self, fn: str, *args, **kwargs):
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        record = {'id': request_id, 'fn': fn, 'args': list(args)}
+        if kwargs:
+            record['kwargs'] = kwargs
+        self._writer.write(json.dumps(record).encode('utf-8') + b'\n')
+        await self._writer.drain()
+        response = await future
+        if not response['ok']:
+            raise RemoteError(response['error'])
+        return response['result']
+
+    async def _read_loop(self):
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._pending.pop(response['id'], None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError('server closed the connection'))
+            self._pending.clear()
+
+    async def close(self):
+        self._writer.close()
+        self._reader_task.cancel()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def load(fn: str, args: list, requests: int = 10000, concurrency: int = 64,
+               connections: int = 4, **address) -> dict:
+    """Fire `requests` calls with `concurrency` outstanding; report latency percentiles."""
+    clients = [await Client.connect(**address) for _ in range(connections)]
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker(client: Client):
+        nonlocal errors
+        for _ in remaining:
+            t0 = time.perf_counter()
+            try:
+                await client.call(fn, *args)
+            except RemoteError:
+                errors += 1
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker(clients[i % connections]) for i in range(concurrency)))
+    wall = time.perf_counter() - t0
+    for client in clients:
+        await client.close()
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'seconds': wall,
+        'requests_per_second': len(latencies) / wall if wall else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1e3,
+        'p99_ms': _percentile(latencies, 0.99) * 1e3,
+        'max_ms': latencies[-1] * 1e3 if latencies else 0.0,
+    }
+
+
+async def serve(host: str = '127.0.0.1', port: int = DEFAULT_PORT, path: str = None, **options):
+    server = Server(**options)
+    listener = await server.start(host, port, path)
+    where = path or f"{host}:{port}"
+    print(f"tin_a server listening on {where}", file=sys.stderr)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Serve problem functions over a local socket.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    for command in ('serve', 'load'):
+        p = sub.add_parser(command)
+        p.add_argument('--host', default='127.0.0.1')
+        p.add_argument('--port', type=int, default=DEFAULT_PORT)
+        p.add_argument('--unix', metavar='PATH', help='Unix domain socket instead of TCP')
+    serve_p = sub.choices['serve']
+    serve_p.add_argument('--batch-window', type=float, default=0.002, help='seconds')
+    serve_p.add_argument('--max-batch', type=int, default=256)
+    serve_p.add_argument('--max-pending', type=int, default=10000)
+    serve_p.add_argument('-w', '--workers', type=int, default=None)
+    load_p = sub.choices['load']
+    load_p.add_argument('--fn', default='problem_3_9_prime_factorization')
+    load_p.add_argument('--args', default='[360]', help='JSON list of arguments')
+    load_p.add_argument('-n', '--requests', type=int, default=10000)
+    load_p.add_argument('-c', '--concurrency', type=int, default=64)
+    load_p.add_argument('--connections', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    address = {'host': args.host, 'port': args.port, 'path': args.unix}
+    if args.command == 'serve':
+        try:
+            asyncio.run(serve(batch_window=args.batch_window, max_batch=args.max_batch,
+                              max_pending=args.max_pending, workers=args.workers, **address))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    report = asyncio.run(load(args.fn, json.loads(args.args), args.requests,
+                              args.concurrency, args.connections, **address))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,345 @@
+"""Section 9: Sets."""
+import math
+import numbers
+import operator
+from typing import Tuple, List
+
+def problem_9_1_common_digits(s1: str, s2: str) -> List[str]:
+    return sorted(set(ch for ch in s1 if ch.isdigit()) & set(ch for ch in s2 if ch.isdigit()))
+
+def problem_9_2_unique_elements(lst: List) -> List:
+    return [x for x in lst if lst.count(x)==1]
+
+def problem_9_3_union_intersection(a:set,b:set) -> Tuple[set,set]:
+    return a|b, a&b
+
+def problem_9_4_remove_duplicates(lst: List) -> List:
+    return list(dict.fromkeys(lst))
+
+def problem_9_5_symmetric_difference(a:set,b:set) -> set:
+    return a ^ b
+
+def problem_9_6_is_subset(a:set,b:set) -> bool:
+    return a.issubset(b)
+
+def problem_9_7_count_unique_vowels_consonants(s:str) -> Tuple[int,int]:
+    s = s.lower()
+    vowels = set([c for c in s if c in 'aeiou'])
+    consonants = set([c for c in s if c.isalpha() and c not in 'aeiou'])
+    return len(vowels), len(consonants)
+
+def problem_9_8_even_set() -> set:
+    return set(range(2,101,2))
+
+def problem_9_9_intersection_three(a:set,b:set,c:set) -> set:
+    return a & b & c
+
+# IntSet: immutable set of ints for the operations above (problem_9_3, 9_5, 9_6, 9_9
+# accept it as-is). Dense values are kept as one bitmap in a Python int (bit i is
+# offset + i), so | & ^ - and subset tests run word by word in C without hashing.
+# Values spread out more than DENSE_BITS_PER_ELEMENT bits apart fall back to a frozenset.
+# Like set, an IntSet treats equal numbers as the same element: 2.0 and numpy.int64(2)
+# are stored (and iterated) as the int 2. Anything that is not integral raises TypeError.
+DENSE_BITS_PER_ELEMENT = 64
+_BYTE_BITS = tuple(tuple(j for j in range(8) if byte >> j & 1) for byte in range(256))
+
+def _integral(x):
+    """x as an int if it equals one (int, numbers.Integral, 2.0, ...), else None."""
+    if isinstance(x, int):
+        return x
+    try:
+        return operator.index(x)
+    except TypeError:
+        pass
+    if isinstance(x, numbers.Real) and math.isfinite(x) and x == int(x):
+        return int(x)
+    return None
+
+def _as_int(x) -> int:
+    i = _integral(x)
+    if i is None:
+        raise TypeError(f"IntSet holds integers only, got {x!r}")
+    return i
+
+class IntSet:
+    """Immutable set of ints, mixes with set/frozenset; iteration is in increasing order."""
+    __slots__ = ('_bits', '_offset', '_sparse', '_len', '_le_bytes', '_hash')
+
+    def __init__(self, values=()):
+        if isinstance(values, IntSet):
+            self._init(values._bits, values._offset, values._sparse, values._len)
+            return
+        if not isinstance(values, (set, frozenset)):
+            values = set(values)
+        if not all(type(x) is int for x in values):
+            values = {_as_int(x) for x in values}
+        n = len(values)
+        if n == 0:
+            self._init(0, 0, None, 0)
+            return
+        lo, hi = min(values), max(values)
+        span = hi - lo + 1
+        if span > DENSE_BITS_PER_ELEMENT * n + 512:
+            self._init(None, 0, frozenset(values), n)
+            return
+        buf = bytearray((span + 7) // 8)
+        for x in values:
+            i = x - lo
+            buf[i >> 3] |= 1 << (i & 7)
+        self._init(int.from_bytes(buf, 'little'), lo, None, n)
+
+    def _init(self, bits, offset, sparse, n):
+        self._bits = bits
+        self._offset = offset
+        self._sparse = sparse
+        self._len = n
+        self._le_bytes = None
+        self._hash = None
+
+    @classmethod
+    def _from_bits(cls, bits: int, offset: int) -> 'IntSet':
+        """Normalized IntSet for a bitmap: low zero bits trimmed, sparse if too spread out."""
+        s = cls.__new__(cls)
+        if bits == 0:
+            s._init(0, 0, None, 0)
+            return s
+        low = (bits & -bits).bit_length() - 1
+        bits >>= low
+        n = bits.bit_count()
+        s._init(bits, offset + low, None, n)
+        if bits.bit_length() > DENSE_BITS_PER_ELEMENT * n + 512:
+            s._init(None, 0, frozenset(s._iter_bits()), n)
+        return s
+
+    @classmethod
+    def range(cls, start: int, stop: int = None, step: int = 1) -> 'IntSet':
+        """IntSet(range(start, stop, step)) without visiting every element."""
+        r = range(start) if stop is None else range(start, stop, step)
+        n = len(r)
+        if n == 0:
+            return cls()
+        step = abs(r.step)
+        if step > DENSE_BITS_PER_ELEMENT:
+            return cls(frozenset(r))
+        # 1 + 2^step + 2^(2 step) + ... in closed form
+        bits = ((1 << (step * n)) - 1) // ((1 << step) - 1)
+        return cls._from_bits(bits, min(r[0], r[-1]))
+
+    # -- conversion --
+    def _bytes(self) -> bytes:
+        if self._le_bytes is None:
+            self._le_bytes = self._bits.to_bytes((self._bits.bit_length() + 7) // 8, 'little')
+        return self._le_bytes
+
+    def _iter_bits(self):
+        offset = self._offset
+        for i, byte in enumerate(self._bytes()):
+            if byte:
+                base = offset + 8 * i
+                for j in _BYTE_BITS[byte]:
+                    yield base + j
+
+    def __iter__(self):
+        if self._sparse is not None:
+            return iter(sorted(self._sparse))
+        return self._iter_bits()
+
+    def to_set(self) -> set:
+        return set(self._sparse) if self._sparse is not None else set(self._iter_bits())
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _top(self) -> int:
+        """Largest value of a dense set (offset - 1 when empty)."""
+        return self._offset + self._bits.bit_length() - 1
+
+    def __contains__(self, x) -> bool:
+        if self._sparse is not None:
+            return x in self._sparse
+        if type(x) is not int:
+            x = _integral(x)
+            if x is None:
+                return False
+        i = x - self._offset
+        return 0 <= i < self._bits.bit_length() and bool(self._bytes()[i >> 3] >> (i & 7) & 1)
+
+    def __repr__(self):
+        return f"IntSet({{{', '.join(map(str, self))}}})" if self._len else 'IntSet()'
+
+    def __sizeof__(self):
+        payload = self._sparse if self._sparse is not None else self._bits
+        return object.__sizeof__(self) + payload.__sizeof__()
+
+    # -- set algebra --
+    @staticmethod
+    def _coerce(other, mixed: bool = False):
+        """other as an IntSet, None if it is not a set. With mixed=True a set holding
+        non-integers comes back as a frozenset instead of raising TypeError."""
+        if isinstance(other, IntSet):
+            return other
+        if isinstance(other, (set, frozenset)):
+            try:
+                return IntSet(other)
+            except TypeError:
+                if not mixed:
+                    raise
+                return frozenset(other)
+        return None
+
+    def _binary(self, other, bit_op, set_op):
+        """| or ^: the result spans both operands, so far-apart bitmaps go through frozensets."""
+        if not other:
+            return self
+        if not self:
+            return other
+        if self._sparse is None and other._sparse is None:
+            offset = min(self._offset, other._offset)
+            span = max(self._top(), other._top()) - offset + 1
+            if span <= DENSE_BITS_PER_ELEMENT * (self._len + other._len) + 512:
+                x = self._bits << (self._offset - offset)
+                y = other._bits << (other._offset - offset)
+                return IntSet._from_bits(bit_op(x, y), offset)
+        return IntSet(set_op(self._frozen(), other._frozen()))
+
+    def _overlaps(self, other) -> bool:
+        """Do the bit ranges of two dense sets overlap?"""
+        return max(self._offset, other._offset) <= min(self._top(), other._top())
+
+    def _frozen(self) -> frozenset:
+        return self._sparse if self._sparse is not None else frozenset(self._iter_bits())
+
+    def __or__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary(other, int.__or__, frozenset.__or__)
+
+    def __and__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        if self._sparse is None and other._sparse is None:
+            if not self._overlaps(other):
+                return IntSet()
+            # the result lies in the overlap, so shift the lower bitmap down, never up
+            offset = max(self._offset, other._offset)
+            x = self._bits >> (offset - self._offset)
+            y = other._bits >> (offset - other._offset)
+            return IntSet._from_bits(x & y, offset)
+        return IntSet(self._frozen() & other._frozen())
+
+    def __xor__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary(other, int.__xor__, frozenset.__xor__)
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        if self._sparse is None and other._sparse is None:
+            if not self._overlaps(other):
+                return self
+            # other starts at or below self's top, so the shift is at most self's width
+            shift = other._offset - self._offset
+            y = other._bits << shift if shift >= 0 else other._bits >> -shift
+            return IntSet._from_bits(self._bits & ~y, self._offset)
+        return IntSet(self._frozen() - other._frozen())
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __rsub__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return other - self
+
+    # comparisons never raise for a set operand: one holding non-integers is compared
+    # as a frozenset (and is never equal to an IntSet)
+    def __le__(self, other):
+        other = self._coerce(other, mixed=True)
+        if other is None:
+            return NotImplemented
+        if isinstance(other, frozenset):
+            return self._frozen() <= other
+        if self._len > other._len:
+            return False
+        if self._sparse is None and other._sparse is None:
+            return not (self - other)
+        return self._frozen() <= other._frozen()
+
+    def __ge__(self, other):
+        other = self._coerce(other, mixed=True)
+        if other is None:
+            return NotImplemented
+        if isinstance(other, frozenset):
+            return self._frozen() >= other
+        return other <= self
+
+    def __lt__(self, other):
+        other = self._coerce(other, mixed=True)
+        if other is None:
+            return NotImplemented
+        if isinstance(other, frozenset):
+            return self._frozen() < other
+        return self._len < other._len and self <= other
+
+    def __gt__(self, other):
+        other = self._coerce(other, mixed=True)
+        if other is None:
+            return NotImplemented
+        if isinstance(other, frozenset):
+            return self._frozen() > other
+        return other < self
+
+    def __eq__(self, other):
+        other = self._coerce(other, mixed=True)
+        if other is None:
+            return NotImplemented
+        if isinstance(other, frozenset):
+            return False
+        # the representation is normalized, so equal sets store the same fields
+        return (self._len == other._len and self._sparse == other._sparse
+                and self._bits == other._bits and self._offset == other._offset)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._frozen())  # equal to hash(frozenset(self)), as == requires
+        return self._hash
+
+    def __bool__(self):
+        return self._len > 0
+
+    def union(self, *others) -> 'IntSet':
+        result = self
+        for other in others:
+            result = result | IntSet(other)
+        return result
+
+    def intersection(self, *others) -> 'IntSet':
+        result = self
+        for other in others:
+            result = result & IntSet(other)
+        return result
+
+    def difference(self, *others) -> 'IntSet':
+        result = self
+        for other in others:
+            result = result - IntSet(other)
+        return result
+
+    def symmetric_difference(self, other) -> 'IntSet':
+        return self ^ IntSet(other)
+
+    def issubset(self, other) -> bool:
+        return self <= IntSet(other)
+
+    def issuperset(self, other) -> bool:
+        return self >= IntSet(other)
+
+    def isdisjoint(self, other) -> bool:
+        return not (self & IntSet(other))
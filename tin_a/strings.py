@@ -0,0 +1,76 @@
+"""Section 5: Strings."""
+from typing import Tuple, List
+
+def problem_5_1_normalize_name(name: str) -> str:
+    parts = name.strip().split()
+    parts = [p.capitalize() for p in parts]
+    return ' '.join(parts)
+
+def problem_5_2_remove_digits(s: str) -> str:
+    return ''.join(ch for ch in s if not ch.isdigit())
+
+def problem_5_3_remove_adjacent_duplicates(s: str) -> str:
+    if not s: return s
+    res = [s[0]]
+    for ch in s[1:]:
+        if ch != res[-1]:
+            res.append(ch)
+    return ''.join(res)
+
+def problem_5_4_insert_between(a: str, b: str, insert: str) -> str:
+    return a + insert + b
+
+def problem_5_5_count_name(names: List[str], target: str) -> int:
+    return sum(1 for n in names if n.strip() == target)
+
+def problem_5_6_print_first_last(fullname: str) -> Tuple[str,str]:
+    parts = fullname.strip().split()
+    if not parts:
+        return ('','')
+    return (parts[0], ' '.join(parts[1:]))
+
+def problem_5_7_count_same_firstname(names: List[str], firstname: str) -> int:
+    return sum(1 for n in names if n.strip().split()[-1] == firstname)
+
+def problem_5_8_count_char(s: str, ch: str) -> int:
+    return s.count(ch)
+
+def problem_5_9_reverse_words(sentence: str) -> str:
+    words = sentence.split()
+    return ' '.join(reversed(words))
+
+def problem_5_10_is_palindrome_string(s: str) -> bool:
+    cleaned = ''.join(ch.lower() for ch in s if ch.isalnum())
+    return cleaned == cleaned[::-1]
+
+def problem_5_11_caesar_cipher(s: str, shift: int=3) -> str:
+    res = []
+    for ch in s:
+        if ch.isalpha():
+            base = 'A' if ch.isupper() else 'a'
+            res.append(chr((ord(ch) - ord(base) + shift) % 26 + ord(base)))
+        else:
+            res.append(ch)
+    return ''.join(res)
+
+def problem_5_12_count_words(sentence: str) -> int:
+    return len(sentence.split())
+
+def problem_5_13_trim_extra_spaces(s: str) -> str:
+    return ' '.join(s.split())
+
+def problem_5_14_is_valid_variable_name(s: str) -> bool:
+    if not s: return False
+    if not (s[0].isalpha() or s[0]=='_'): return False
+    return all(ch.isalnum() or ch=='_' for ch in s)
+
+def problem_5_15_normalize_phone(phone: str) -> str:
+    digits = ''.join(ch for ch in phone if ch.isdigit())
+    if digits.startswith('0'):
+        return '+84' + digits[1:]
+    if digits.startswith('84'):
+        return '+' + digits
+    return digits
+
+def problem_5_16_swap_case(s: str) -> str:
+    return s.swapcase()